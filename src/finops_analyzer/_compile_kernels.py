@@ -0,0 +1,24 @@
+"""Ahead-of-time compile the indicator kernels with Numba.
+
+Run ``python -m finops_analyzer._compile_kernels`` (requires the ``fast`` extra)
+before building a wheel. It writes the ``_kernels_aot`` extension module next
+to this file; ``stock_fetcher`` imports it when present so the CLI does not pay
+JIT compilation cost on its first call, and falls back to ``_kernels`` otherwise.
+"""
+
+from pathlib import Path
+
+from numba.pycc import CC
+
+from . import _kernels
+
+cc = CC("_kernels_aot")
+cc.output_dir = str(Path(__file__).parent)
+
+cc.export("rsi", "f8(f8[:], i8)")(_kernels._rsi_loop)
+cc.export("volatility", "f8(f8[:], i8)")(_kernels._volatility_loop)
+cc.export("moving_average", "f8(f8[:], i8)")(_kernels._moving_average_loop)
+
+
+if __name__ == "__main__":
+    cc.compile()
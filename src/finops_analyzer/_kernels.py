@@ -0,0 +1,94 @@
+"""Numeric kernels for technical indicators.
+
+The kernels operate on raw ``float64`` price arrays. When Numba is installed
+(``pip install "finops-analyzer[fast]"``) the scalar loops are JIT-compiled;
+otherwise equivalent vectorized NumPy implementations are used.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    njit = None
+
+
+def _rsi_loop(prices: np.ndarray, period: int) -> float:
+    """Relative Strength Index from the average gain/loss of the last ``period`` moves."""
+    n = prices.shape[0]
+    gain = 0.0
+    loss = 0.0
+    for i in range(n - period, n):
+        delta = prices[i] - prices[i - 1]
+        if delta > 0.0:
+            gain += delta
+        elif delta < 0.0:
+            loss -= delta
+
+    if loss == 0.0:
+        return 100.0 if gain > 0.0 else math.nan
+    return 100.0 - 100.0 / (1.0 + gain / loss)
+
+
+def _volatility_loop(prices: np.ndarray, window: int) -> float:
+    """Annualized volatility (%) of the last ``window`` daily returns."""
+    n = prices.shape[0]
+    start = max(1, n - window)
+    count = n - start
+
+    mean = 0.0
+    for i in range(start, n):
+        mean += prices[i] / prices[i - 1] - 1.0
+    mean /= count
+
+    variance = 0.0
+    for i in range(start, n):
+        deviation = prices[i] / prices[i - 1] - 1.0 - mean
+        variance += deviation * deviation
+
+    return math.sqrt(variance / (count - 1)) * math.sqrt(252.0) * 100.0
+
+
+def _moving_average_loop(prices: np.ndarray, window: int) -> float:
+    """Simple moving average over the last ``window`` prices."""
+    n = prices.shape[0]
+    total = 0.0
+    for i in range(n - window, n):
+        total += prices[i]
+    return total / window
+
+
+def _rsi_numpy(prices: np.ndarray, period: int) -> float:
+    """Vectorized equivalent of :func:`_rsi_loop`."""
+    delta = np.diff(prices[-(period + 1) :])
+    gain = np.where(delta > 0, delta, 0.0).sum()
+    loss = np.where(delta < 0, -delta, 0.0).sum()
+
+    if loss == 0.0:
+        return 100.0 if gain > 0.0 else math.nan
+    return float(100.0 - 100.0 / (1.0 + gain / loss))
+
+
+def _volatility_numpy(prices: np.ndarray, window: int) -> float:
+    """Vectorized equivalent of :func:`_volatility_loop`."""
+    start = max(1, prices.shape[0] - window)
+    returns = prices[start:] / prices[start - 1 : -1] - 1.0
+    return float(returns.std(ddof=1) * math.sqrt(252.0) * 100.0)
+
+
+def _moving_average_numpy(prices: np.ndarray, window: int) -> float:
+    """Vectorized equivalent of :func:`_moving_average_loop`."""
+    return float(prices[-window:].mean())
+
+
+if njit is not None:
+    # nogil lets the analyzer's worker threads run kernels for different symbols in parallel
+    rsi = njit(cache=True, nogil=True)(_rsi_loop)
+    volatility = njit(cache=True, nogil=True)(_volatility_loop)
+    moving_average = njit(cache=True, nogil=True)(_moving_average_loop)
+else:
+    rsi = _rsi_numpy
+    volatility = _volatility_numpy
+    moving_average = _moving_average_numpy
@@ -2,18 +2,27 @@
 
 import csv
 import logging
+import threading
+import time
 from collections.abc import Callable
-from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cached_property
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-from .config import get_settings
+from .config import SentimentBackend, get_settings
 from .dashboard import create_progress_bar
-from .models import Portfolio, PortfolioAnalysis, StockHolding
-from .sentiment import get_ai_analyzer, get_news_fetcher
-from .stock_fetcher import get_stock_fetcher
+from .models import NewsArticle, Portfolio, PortfolioAnalysis, SentimentScore, StockHolding
+from .stock_fetcher import ANALYSIS_HISTORY_DAYS, get_stock_fetcher
+
+if TYPE_CHECKING:
+    from .sentiment import AIAnalyzer, NewsFetcher
 
 logger = logging.getLogger(__name__)
 
+# Minimum seconds between progress bar repaints
+PROGRESS_REFRESH_INTERVAL = 0.05
+
 
 class PortfolioAnalyzer:
     """Main analysis engine for portfolios."""
@@ -21,8 +30,20 @@ class PortfolioAnalyzer:
     def __init__(self):
         self.settings = get_settings()
         self.stock_fetcher = get_stock_fetcher()
-        self.news_fetcher = get_news_fetcher()
-        self.ai_analyzer = get_ai_analyzer()
+
+    @cached_property
+    def news_fetcher(self) -> "NewsFetcher":
+        """Lazy load the news fetcher (skipped entirely with --no-news)."""
+        from .sentiment import get_news_fetcher
+
+        return get_news_fetcher()
+
+    @cached_property
+    def ai_analyzer(self) -> "AIAnalyzer":
+        """Lazy load the AI analyzer so provider SDKs are only imported when used."""
+        from .sentiment import get_ai_analyzer
+
+        return get_ai_analyzer()
 
     def load_portfolio_from_csv(self, csv_path: Path) -> Portfolio:
         """Load portfolio from a CSV file.
@@ -34,18 +55,34 @@ class PortfolioAnalyzer:
         """
         holdings = []
 
-        with open(csv_path) as f:
-            reader = csv.DictReader(f)
+        with open(csv_path, newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+
+            # Resolve column positions once instead of building a dict per row
+            columns = {name: i for i, name in enumerate(header)}
+            i_symbol = columns.get("symbol", -1)
+            i_shares = columns.get("shares", -1)
+            i_cost = columns.get("cost_basis", -1)
+            if i_symbol < 0:
+                return Portfolio(name=csv_path.stem, holdings=holdings)
+
             for row in reader:
-                symbol = row.get("symbol", "").strip().upper()
+                n = len(row)
+                symbol = row[i_symbol].strip().upper() if i_symbol < n else ""
                 if not symbol:
                     continue
 
-                shares = Decimal(row.get("shares", "0").strip() or "0")
-                cost_basis_str = row.get("cost_basis", "").strip()
-                cost_basis = Decimal(cost_basis_str) if cost_basis_str else None
+                shares_str = row[i_shares].strip() if 0 <= i_shares < n else ""
+                cost_basis_str = row[i_cost].strip() if 0 <= i_cost < n else ""
 
-                holdings.append(StockHolding(symbol=symbol, shares=shares, cost_basis=cost_basis))
+                holdings.append(
+                    StockHolding(
+                        symbol=symbol,
+                        shares=float(shares_str or "0"),
+                        cost_basis=float(cost_basis_str) if cost_basis_str else None,
+                    )
+                )
 
         return Portfolio(name=csv_path.stem, holdings=holdings)
 
@@ -59,8 +96,8 @@ class PortfolioAnalyzer:
         holdings = []
 
         for i, symbol in enumerate(symbols):
-            share_count = Decimal(str(shares[i])) if shares and i < len(shares) else Decimal("1")
-            basis = Decimal(str(cost_basis[i])) if cost_basis and i < len(cost_basis) else None
+            share_count = float(shares[i]) if shares and i < len(shares) else 1.0
+            basis = float(cost_basis[i]) if cost_basis and i < len(cost_basis) else None
 
             holdings.append(StockHolding(symbol=symbol.upper(), shares=share_count, cost_basis=basis))
 
@@ -78,41 +115,49 @@ class PortfolioAnalyzer:
         analysis = PortfolioAnalysis(portfolio=portfolio)
         total_steps = len(portfolio.holdings) * (3 if include_news else 2) + (1 if include_ai_insights else 0)
         current_step = 0
+        progress_lock = threading.Lock()
 
         def update_progress(description: str):
             nonlocal current_step
-            current_step += 1
-            if progress_callback:
-                progress_callback(current_step, total_steps, description)
+            with progress_lock:
+                current_step += 1
+                if progress_callback:
+                    progress_callback(current_step, total_steps, description)
 
         # Step 1: Enrich holdings with current data
-        for holding in portfolio.holdings:
-            update_progress(f"Fetching data for {holding.symbol}")
-            self.stock_fetcher.enrich_holding(holding)
+        symbols = list(dict.fromkeys(h.symbol for h in portfolio.holdings))
+        self.stock_fetcher.open_tickers(symbols)
+        self._map_holdings(
+            portfolio.holdings,
+            self.stock_fetcher.enrich_holding,
+            lambda symbol: update_progress(f"Fetched data for {symbol}"),
+        )
+        portfolio.finalize()
 
         # Step 2: Technical analysis for each stock
+        self.stock_fetcher.prefetch_history(symbols, period_days=ANALYSIS_HISTORY_DAYS)
+        stock_analyses = self._map_holdings(
+            portfolio.holdings,
+            lambda holding: self.stock_fetcher.analyze_stock(holding.symbol),
+            lambda symbol: update_progress(f"Analyzed {symbol}"),
+        )
         for holding in portfolio.holdings:
-            update_progress(f"Analyzing {holding.symbol}")
-            stock_analysis = self.stock_fetcher.analyze_stock(holding.symbol)
-            analysis.stock_analyses[holding.symbol] = stock_analysis
+            analysis.stock_analyses[holding.symbol] = stock_analyses[holding.symbol]
 
         # Step 3: News and sentiment analysis
         if include_news:
+            news = self._fetch_news(portfolio.holdings)
+            sentiments = self._analyze_sentiments(portfolio.holdings, news)
+
             for holding in portfolio.holdings:
-                update_progress(f"Analyzing news for {holding.symbol}")
+                update_progress(f"Analyzed news for {holding.symbol}")
+                articles, overall_sentiment, summary = sentiments.get(
+                    holding.symbol, (news.get(holding.symbol, []), None, None)
+                )
                 stock_analysis = analysis.stock_analyses[holding.symbol]
-
-                # Fetch news
-                articles = self.news_fetcher.fetch_news(holding.symbol)
-
-                # AI sentiment analysis
-                if articles and self.settings.get_active_api_key():
-                    articles, overall_sentiment, summary = self.ai_analyzer.analyze_sentiment(holding.symbol, articles)
-                    stock_analysis.news_articles = articles
-                    stock_analysis.overall_sentiment = overall_sentiment
-                    stock_analysis.sentiment_summary = summary
-                else:
-                    stock_analysis.news_articles = articles
+                stock_analysis.news_articles = articles
+                stock_analysis.overall_sentiment = overall_sentiment
+                stock_analysis.sentiment_summary = summary
 
         # Step 4: Portfolio-level AI insights
         if include_ai_insights and self.settings.get_active_api_key():
@@ -142,6 +187,67 @@ Sector Allocation: {portfolio.get_sector_allocation()}
 
         return analysis
 
+    def _map_holdings(
+        self,
+        holdings: list[StockHolding],
+        func: Callable[[StockHolding], Any],
+        on_complete: Callable[[str], None],
+    ) -> dict[str, Any]:
+        """Run ``func`` for every holding on a thread pool, keyed by symbol.
+
+        The per-holding work is dominated by network round-trips, so running it
+        concurrently keeps wall-clock time close to a single request.
+        """
+        results: dict[str, Any] = {}
+        if not holdings:
+            return results
+
+        max_workers = max(1, min(self.settings.max_concurrent_requests, len(holdings)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(func, holding): holding.symbol for holding in holdings}
+            for future in as_completed(futures):
+                symbol = futures[future]
+                results[symbol] = future.result()
+                on_complete(symbol)
+
+        return results
+
+    def _fetch_news(self, holdings: list[StockHolding]) -> dict[str, list[NewsArticle]]:
+        """Fetch news for all holdings, batching into one request where the provider allows."""
+        news = self.news_fetcher.fetch_news_bulk([h.symbol for h in holdings])
+
+        # Fall back to per-symbol lookups for anything the batched request missed
+        missing = [h for h in holdings if h.symbol not in news]
+        news.update(
+            self._map_holdings(missing, lambda holding: self.news_fetcher.fetch_news(holding.symbol), lambda _: None)
+        )
+        return news
+
+    def _analyze_sentiments(
+        self, holdings: list[StockHolding], news: dict[str, list[NewsArticle]]
+    ) -> dict[str, tuple[list[NewsArticle], SentimentScore | None, str | None]]:
+        """Run AI sentiment analysis for all holdings in a single call, per symbol on failure."""
+        if self.settings.sentiment_backend == SentimentBackend.FINBERT:
+            return self.ai_analyzer.analyze_sentiment_bulk(news)
+
+        if not self.settings.get_active_api_key():
+            return {}
+
+        sentiments = self.ai_analyzer.analyze_sentiment_bulk(news)
+        if self.settings.batch_mode:
+            # Don't re-bill symbols the batch missed with interactive calls
+            return sentiments
+
+        pending = [h for h in holdings if news.get(h.symbol) and h.symbol not in sentiments]
+        sentiments.update(
+            self._map_holdings(
+                pending,
+                lambda holding: self.ai_analyzer.analyze_sentiment(holding.symbol, news[holding.symbol]),
+                lambda _: None,
+            )
+        )
+        return sentiments
+
     def analyze_with_progress(
         self, portfolio: Portfolio, include_news: bool = True, include_ai_insights: bool = True
     ) -> PortfolioAnalysis:
@@ -150,18 +256,55 @@ Sector Allocation: {portfolio.get_sector_allocation()}
         with create_progress_bar() as progress:
             task = progress.add_task("Analyzing portfolio...", total=100)
 
-            def progress_callback(current: int, total: int, description: str):
+            refresh_lock = threading.Lock()
+            last_refresh = 0.0
+            pending: tuple[int, int, str] | None = None
+            flush_timer: threading.Timer | None = None
+
+            def render(current: int, total: int, description: str):
+                nonlocal last_refresh
+                last_refresh = time.monotonic()
                 pct = (current / total) * 100 if total > 0 else 0
-                progress.update(task, completed=pct, description=description)
+                progress.update(task, completed=pct, description=description, refresh=True)
 
-            result = self.analyze_portfolio(
-                portfolio,
-                include_news=include_news,
-                include_ai_insights=include_ai_insights,
-                progress_callback=progress_callback,
-            )
+            def flush_pending():
+                nonlocal pending, flush_timer
+                with refresh_lock:
+                    flush_timer = None
+                    if pending is not None:
+                        render(*pending)
+                        pending = None
 
-            progress.update(task, completed=100, description="Analysis complete!")
+            def progress_callback(current: int, total: int, description: str):
+                nonlocal pending, flush_timer
+                with refresh_lock:
+                    wait = PROGRESS_REFRESH_INTERVAL - (time.monotonic() - last_refresh)
+                    if current < total and wait > 0:
+                        # Trailing edge: paint the latest skipped update once the interval has
+                        # passed, so the bar isn't left stale during the next blocking phase
+                        pending = (current, total, description)
+                        if flush_timer is None:
+                            flush_timer = threading.Timer(wait, flush_pending)
+                            flush_timer.daemon = True
+                            flush_timer.start()
+                        return
+                    pending = None
+                    render(current, total, description)
+
+            try:
+                result = self.analyze_portfolio(
+                    portfolio,
+                    include_news=include_news,
+                    include_ai_insights=include_ai_insights,
+                    progress_callback=progress_callback,
+                )
+            finally:
+                with refresh_lock:
+                    pending = None
+                    if flush_timer is not None:
+                        flush_timer.cancel()
+
+            progress.update(task, completed=100, description="Analysis complete!", refresh=True)
 
         return result
 
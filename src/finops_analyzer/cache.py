@@ -0,0 +1,127 @@
+"""Cache helpers shared by the data fetchers and AI analyzer."""
+
+import functools
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+import msgpack
+from diskcache import UNKNOWN, Cache, Disk
+
+from .config import get_settings
+
+# Keep values up to 1 MiB inline in SQLite instead of spilling them to separate files
+DISK_MIN_FILE_SIZE = 2**20
+
+# msgpack extension type code for datetimes, stored as ISO 8601 so naive values round-trip
+_DATETIME_EXT = 1
+
+
+def _pack_default(value: Any) -> msgpack.ExtType:
+    if isinstance(value, datetime):
+        return msgpack.ExtType(_DATETIME_EXT, value.isoformat().encode("utf-8"))
+    raise TypeError(f"Cannot serialize {type(value).__name__} to the cache")
+
+
+def _unpack_ext(code: int, data: bytes) -> Any:
+    if code == _DATETIME_EXT:
+        return datetime.fromisoformat(data.decode("utf-8"))
+    return msgpack.ExtType(code, data)
+
+
+class MsgpackDisk(Disk):
+    """diskcache serializer that stores values as msgpack instead of pickle.
+
+    Cached values are plain data (API dicts, article dumps, raw price buffers), which
+    msgpack encodes faster and more compactly than pickle. Keys keep diskcache's
+    native handling.
+    """
+
+    def store(self, value: Any, read: bool, key: Any = UNKNOWN) -> tuple:
+        if not read:
+            value = msgpack.packb(value, use_bin_type=True, default=_pack_default)
+        return super().store(value, read, key=key)
+
+    def fetch(self, mode: int, filename: str | None, value: Any, read: bool) -> Any:
+        data = super().fetch(mode, filename, value, read)
+        if not read:
+            data = msgpack.unpackb(data, raw=False, ext_hook=_unpack_ext)
+        return data
+
+
+# Singleton instance shared by every fetcher; entries are namespaced by key prefix
+_cache: Cache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> Cache | None:
+    """Get the shared disk cache under the configured cache directory.
+
+    Returns None when caching is disabled so callers can skip cache lookups.
+    """
+    global _cache
+    settings = get_settings()
+    if not settings.cache_enabled:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            settings.cache_dir.mkdir(parents=True, exist_ok=True)
+            _cache = Cache(
+                str(settings.cache_dir / "data-msgpack"),
+                disk=MsgpackDisk,
+                disk_min_file_size=DISK_MIN_FILE_SIZE,
+                eviction_policy="least-recently-used",
+            )
+    return _cache
+
+
+def make_key(prefix: str, *parts: object) -> str:
+    """Build a stable cache key from an MD5 hash of the given parts."""
+    digest = hashlib.md5(json.dumps(parts, default=str).encode("utf-8")).hexdigest()
+    return f"{prefix}_{digest}"
+
+
+def memoize(maxsize: int = 256) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Memoize a fetcher method in process memory, in front of the disk cache.
+
+    Entries are keyed on the call arguments (excluding ``self``), evicted
+    least-recently-used beyond ``maxsize``, and expire after the configured
+    cache TTL. Nothing is memoized when caching is disabled.
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        entries: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+            settings = get_settings()
+            if not settings.cache_enabled:
+                return func(self, *args, **kwargs)
+
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            with lock:
+                entry = entries.get(key)
+                if entry is not None and now - entry[0] < settings.cache_ttl_seconds:
+                    entries.move_to_end(key)
+                    return entry[1]
+
+            value = func(self, *args, **kwargs)
+
+            with lock:
+                entries[key] = (now, value)
+                entries.move_to_end(key)
+                while len(entries) > maxsize:
+                    entries.popitem(last=False)
+            return value
+
+        wrapper.cache_clear = entries.clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
@@ -8,7 +8,6 @@ from rich.panel import Panel
 from rich.text import Text
 
 from . import __version__
-from .analyzer import get_analyzer
 from .config import get_settings
 from .dashboard import console, display_full_report
 
@@ -73,6 +72,8 @@ def analyze(
 
         finops analyze portfolio.csv --no-ai
     """
+    from .analyzer import get_analyzer
+
     analyzer = get_analyzer()
     settings = get_settings()
 
@@ -125,11 +126,8 @@ def analyze(
 
     # Save to JSON if requested
     if output_json:
-        import json
-
         output_json.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_json, "w") as f:
-            json.dump(analysis.model_dump(mode="json"), f, indent=2, default=str)
+        output_json.write_text(analysis.model_dump_json(indent=2), encoding="utf-8")
         console.print(f"\n💾 Results saved to [cyan]{output_json}[/cyan]")
 
 
@@ -142,8 +140,6 @@ def quote(symbol: str = typer.Argument(..., help="Stock symbol to look up")):
 
         finops quote AAPL
     """
-    from decimal import Decimal
-
     from .models import StockHolding
     from .stock_fetcher import get_stock_fetcher
 
@@ -151,7 +147,7 @@ def quote(symbol: str = typer.Argument(..., help="Stock symbol to look up")):
 
     console.print(f"📊 Fetching quote for [cyan]{symbol.upper()}[/cyan]...\n")
 
-    holding = StockHolding(symbol=symbol.upper(), shares=Decimal("1"))
+    holding = StockHolding(symbol=symbol.upper(), shares=1.0)
     holding = fetcher.enrich_holding(holding)
     analysis = fetcher.analyze_stock(symbol.upper())
 
@@ -206,26 +202,25 @@ def demo():
 
     Uses a sample portfolio to demonstrate the tool.
     """
-    from decimal import Decimal
-
+    from .analyzer import get_analyzer
     from .models import Portfolio, StockHolding
 
     console.print("[bold cyan]🎮 Running FinOps Analyzer Demo[/bold cyan]\n")
 
     # Create sample portfolio
     sample_holdings = [
-        StockHolding(symbol="AAPL", shares=Decimal("50"), cost_basis=Decimal("150")),
-        StockHolding(symbol="GOOGL", shares=Decimal("20"), cost_basis=Decimal("120")),
-        StockHolding(symbol="MSFT", shares=Decimal("30"), cost_basis=Decimal("350")),
-        StockHolding(symbol="AMZN", shares=Decimal("15"), cost_basis=Decimal("140")),
-        StockHolding(symbol="NVDA", shares=Decimal("10"), cost_basis=Decimal("400")),
+        StockHolding(symbol="AAPL", shares=50, cost_basis=150),
+        StockHolding(symbol="GOOGL", shares=20, cost_basis=120),
+        StockHolding(symbol="MSFT", shares=30, cost_basis=350),
+        StockHolding(symbol="AMZN", shares=15, cost_basis=140),
+        StockHolding(symbol="NVDA", shares=10, cost_basis=400),
     ]
 
     portfolio = Portfolio(name="Demo Portfolio", holdings=sample_holdings)
 
     console.print("📊 Demo Portfolio:")
     for h in sample_holdings:
-        console.print(f"  • {h.symbol}: {h.shares} shares @ ${h.cost_basis}")
+        console.print(f"  • {h.symbol}: {h.shares:g} shares @ ${h.cost_basis:g}")
     console.print()
 
     # Run analysis (without AI to avoid API costs)
@@ -14,6 +14,13 @@ class AIProvider(str, Enum):
     ANTHROPIC = "anthropic"
 
 
+class SentimentBackend(str, Enum):
+    """Supported backends for per-article sentiment classification."""
+
+    LLM = "llm"
+    FINBERT = "finbert"
+
+
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
 
@@ -26,16 +33,41 @@ class Settings(BaseSettings):
     anthropic_api_key: SecretStr | None = Field(default=None, description="Anthropic API key")
     anthropic_model: str = Field(default="claude-3-haiku-20240307", description="Anthropic model to use")
 
+    # Batch API Configuration
+    batch_mode: bool = Field(
+        default=False, description="Send sentiment requests through the provider batch API (cheaper, asynchronous)"
+    )
+    batch_poll_interval_seconds: int = Field(default=30, description="Seconds between batch status checks")
+    batch_timeout_seconds: int = Field(default=24 * 3600, description="Maximum seconds to wait for a batch")
+
+    # Sentiment Configuration
+    sentiment_backend: SentimentBackend = Field(
+        default=SentimentBackend.LLM, description="Per-article sentiment backend (llm or local finbert)"
+    )
+    finbert_model: str = Field(default="ProsusAI/finbert", description="Hugging Face model used by the finbert backend")
+    finbert_quantized: bool = Field(
+        default=False, description="Serve FinBERT as an int8-quantized ONNX Runtime model for faster CPU inference"
+    )
+
     # News API
     newsapi_key: SecretStr | None = Field(default=None, description="NewsAPI.org API key (optional)")
 
     # Analysis Configuration
     analysis_period_days: int = Field(default=30, description="Default analysis period in days")
     sentiment_news_count: int = Field(default=5, description="Number of news articles to analyze per stock")
+    sentiment_batch_size: int = Field(default=10, description="Maximum stocks per batched sentiment AI call")
+
+    # Network Configuration
+    max_concurrent_requests: int = Field(
+        default=8, description="Maximum concurrent per-stock API requests (keeps under provider rate limits)"
+    )
 
     # Cache Configuration
     cache_enabled: bool = Field(default=True, description="Enable caching of API responses")
     cache_ttl_seconds: int = Field(default=3600, description="Cache TTL in seconds (1 hour default)")
+    profile_cache_ttl_seconds: int = Field(
+        default=86400, description="Cache TTL for company profile data (sector, industry, ratios) in seconds"
+    )
     cache_dir: Path = Field(default=Path.home() / ".finops-analyzer" / "cache", description="Cache directory")
 
     def get_active_api_key(self) -> SecretStr | None:
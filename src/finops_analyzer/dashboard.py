@@ -1,11 +1,12 @@
 """Rich terminal dashboard for beautiful portfolio reports."""
 
-from decimal import Decimal
+from bisect import bisect_left, bisect_right
 
 from rich import box
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
+from rich.progress_bar import ProgressBar
 from rich.table import Table
 from rich.text import Text
 
@@ -14,8 +15,8 @@ from .models import Portfolio, PortfolioAnalysis, RiskLevel, SentimentScore, Sto
 console = Console()
 
 
-def format_currency(value: Decimal | None, prefix: str = "$") -> str:
-    """Format a decimal as currency."""
+def format_currency(value: float | None, prefix: str = "$") -> str:
+    """Format a number as currency."""
     if value is None:
         return "N/A"
     return f"{prefix}{value:,.2f}"
@@ -31,19 +32,23 @@ def format_percent(value: float | None, with_sign: bool = True) -> str:
     return f"{value:.2f}%"
 
 
+# Percent styles by band: < -5, [-5, 0), 0, (0, 5], > 5
+_PERCENT_STYLES = ("bold red", "red", "yellow", "green", "bold green")
+_PERCENT_LOW_THRESHOLDS = (-5, 0)
+_PERCENT_HIGH_THRESHOLDS = (0, 5)
+
+# Score styles for the 0-100 AI scores, indexed by band
+_SCORE_STYLES = ("red", "yellow", "green")
+_DIVERSIFICATION_THRESHOLDS = (40, 70)
+_RISK_STYLES = ("green", "yellow", "red")
+_RISK_THRESHOLDS = (30, 60)
+
+
 def get_percent_style(value: float | None) -> str:
     """Get style based on percentage value."""
     if value is None:
         return ""
-    if value > 5:
-        return "bold green"
-    elif value > 0:
-        return "green"
-    elif value < -5:
-        return "bold red"
-    elif value < 0:
-        return "red"
-    return "yellow"
+    return _PERCENT_STYLES[bisect_right(_PERCENT_LOW_THRESHOLDS, value) + bisect_left(_PERCENT_HIGH_THRESHOLDS, value)]
 
 
 def get_sentiment_display(sentiment: SentimentScore | None) -> Text:
@@ -94,20 +99,26 @@ def create_holdings_table(portfolio: Portfolio) -> Table:
     table.add_column("Allocation", justify="right")
 
     allocation = portfolio.get_allocation()
+    add_row = table.add_row
 
     for holding in portfolio.holdings:
-        gain_style = get_percent_style(holding.gain_loss_percent)
-
-        table.add_row(
-            holding.symbol,
+        symbol = holding.symbol
+        cost_basis = holding.cost_basis
+        gain_percent = holding.gain_loss_percent
+        gain_style = get_percent_style(gain_percent)
+        gain_text = format_percent(gain_percent)
+
+        # Markup strings are styled at render time without allocating a Text per cell
+        add_row(
+            symbol,
             holding.company_name or "Unknown",
             f"{holding.shares:,.2f}",
             format_currency(holding.current_price),
             format_currency(holding.current_value),
-            format_currency(holding.cost_basis) if holding.cost_basis else "N/A",
+            format_currency(cost_basis) if cost_basis else "N/A",
             format_currency(holding.total_gain_loss),
-            Text(format_percent(holding.gain_loss_percent), style=gain_style),
-            f"{allocation.get(holding.symbol, 0):.1f}%",
+            f"[{gain_style}]{gain_text}[/]" if gain_style else gain_text,
+            f"{allocation.get(symbol, 0):.1f}%",
         )
 
     return table
@@ -189,9 +200,8 @@ def create_sector_table(portfolio: Portfolio) -> Table:
 
     sector_alloc = portfolio.get_sector_allocation()
     for sector, pct in sorted(sector_alloc.items(), key=lambda x: x[1], reverse=True):
-        bar_width = int(pct / 100 * 25)
-        bar = "█" * bar_width + "░" * (25 - bar_width)
-        table.add_row(sector, f"{pct:.1f}%", Text(bar, style="cyan"))
+        bar = ProgressBar(total=100, completed=pct, width=25, complete_style="cyan", finished_style="cyan")
+        table.add_row(sector, f"{pct:.1f}%", bar)
 
     return table
 
@@ -206,18 +216,12 @@ def create_insights_panel(analysis: PortfolioAnalysis) -> Panel:
 
     if analysis.diversification_score is not None:
         content.append("🎯 Diversification Score: ", style="bold")
-        score_style = (
-            "green"
-            if analysis.diversification_score >= 70
-            else "yellow"
-            if analysis.diversification_score >= 40
-            else "red"
-        )
+        score_style = _SCORE_STYLES[bisect_right(_DIVERSIFICATION_THRESHOLDS, analysis.diversification_score)]
         content.append(f"{analysis.diversification_score}/100\n", style=score_style)
 
     if analysis.risk_score is not None:
         content.append("⚠️ Risk Score: ", style="bold")
-        risk_style = "green" if analysis.risk_score <= 30 else "yellow" if analysis.risk_score <= 60 else "red"
+        risk_style = _RISK_STYLES[bisect_left(_RISK_THRESHOLDS, analysis.risk_score)]
         content.append(f"{analysis.risk_score}/100\n", style=risk_style)
 
     if analysis.overall_sentiment:
@@ -307,11 +311,15 @@ def display_full_report(analysis: PortfolioAnalysis) -> None:
 
 
 def create_progress_bar() -> Progress:
-    """Create a rich progress bar for analysis."""
+    """Create a rich progress bar for analysis.
+
+    Auto-refresh is disabled; callers repaint explicitly with ``refresh=True``.
+    """
     return Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         BarColumn(),
         TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
         console=console,
+        auto_refresh=False,
     )
@@ -0,0 +1,28 @@
+"""Shared HTTP client for outbound REST calls (NewsAPI).
+
+The LLM SDKs keep their own pooled clients: they rely on their default long read
+timeouts for streamed and batch calls, and not every SDK release accepts a plain
+``httpx.Client``.
+"""
+
+import atexit
+import threading
+
+import httpx
+
+# Pool sized for the per-holding thread pool in the analyzer
+HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+# Singleton instance, created under a lock since holdings are enriched from a thread pool
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.Client:
+    """Get singleton HTTP/2 client with keep-alive connection pooling."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = httpx.Client(http2=True, limits=HTTP_LIMITS, timeout=10)
+            atexit.register(_client.close)
+    return _client
@@ -1,10 +1,11 @@
 """Core data models for portfolio analysis."""
 
+from dataclasses import dataclass
 from datetime import datetime
-from decimal import Decimal
 from enum import Enum
 
-from pydantic import BaseModel, Field, computed_field
+import numpy as np
+from pydantic import BaseModel, Field, PrivateAttr, computed_field
 
 
 class SentimentScore(str, Enum):
@@ -19,24 +20,29 @@ class SentimentScore(str, Enum):
     @property
     def emoji(self) -> str:
         """Get emoji representation of sentiment."""
-        return {
-            self.VERY_BEARISH: "🔴",
-            self.BEARISH: "🟠",
-            self.NEUTRAL: "🟡",
-            self.BULLISH: "🟢",
-            self.VERY_BULLISH: "🟢✨",
-        }[self]
+        return _SENTIMENT_EMOJI[self]
 
     @property
     def score(self) -> float:
         """Get numeric score (-1 to 1)."""
-        return {
-            self.VERY_BEARISH: -1.0,
-            self.BEARISH: -0.5,
-            self.NEUTRAL: 0.0,
-            self.BULLISH: 0.5,
-            self.VERY_BULLISH: 1.0,
-        }[self]
+        return _SENTIMENT_SCORE[self]
+
+
+_SENTIMENT_EMOJI = {
+    SentimentScore.VERY_BEARISH: "🔴",
+    SentimentScore.BEARISH: "🟠",
+    SentimentScore.NEUTRAL: "🟡",
+    SentimentScore.BULLISH: "🟢",
+    SentimentScore.VERY_BULLISH: "🟢✨",
+}
+
+_SENTIMENT_SCORE = {
+    SentimentScore.VERY_BEARISH: -1.0,
+    SentimentScore.BEARISH: -0.5,
+    SentimentScore.NEUTRAL: 0.0,
+    SentimentScore.BULLISH: 0.5,
+    SentimentScore.VERY_BULLISH: 1.0,
+}
 
 
 class RiskLevel(str, Enum):
@@ -49,54 +55,57 @@ class RiskLevel(str, Enum):
 
     @property
     def emoji(self) -> str:
-        return {
-            self.LOW: "🟢",
-            self.MEDIUM: "🟡",
-            self.HIGH: "🟠",
-            self.VERY_HIGH: "🔴",
-        }[self]
+        return _RISK_EMOJI[self]
+
+
+_RISK_EMOJI = {
+    RiskLevel.LOW: "🟢",
+    RiskLevel.MEDIUM: "🟡",
+    RiskLevel.HIGH: "🟠",
+    RiskLevel.VERY_HIGH: "🔴",
+}
 
 
 class StockHolding(BaseModel):
     """Represents a single stock holding in the portfolio."""
 
     symbol: str = Field(..., description="Stock ticker symbol (e.g., AAPL)")
-    shares: Decimal = Field(..., gt=0, description="Number of shares owned")
-    cost_basis: Decimal | None = Field(default=None, description="Average purchase price per share")
+    shares: float = Field(..., gt=0, description="Number of shares owned")
+    cost_basis: float | None = Field(default=None, description="Average purchase price per share")
 
     # Populated after fetching data
-    current_price: Decimal | None = None
+    current_price: float | None = None
     company_name: str | None = None
     sector: str | None = None
     industry: str | None = None
-    market_cap: Decimal | None = None
+    market_cap: float | None = None
     pe_ratio: float | None = None
     dividend_yield: float | None = None
-    fifty_two_week_high: Decimal | None = None
-    fifty_two_week_low: Decimal | None = None
+    fifty_two_week_high: float | None = None
+    fifty_two_week_low: float | None = None
 
-    @computed_field
+    @computed_field(repr=False)
     @property
-    def current_value(self) -> Decimal | None:
+    def current_value(self) -> float | None:
         """Calculate current market value of holding."""
         if self.current_price:
             return self.shares * self.current_price
         return None
 
-    @computed_field
+    @computed_field(repr=False)
     @property
-    def total_gain_loss(self) -> Decimal | None:
+    def total_gain_loss(self) -> float | None:
         """Calculate total unrealized gain/loss."""
         if self.current_price and self.cost_basis:
             return (self.current_price - self.cost_basis) * self.shares
         return None
 
-    @computed_field
+    @computed_field(repr=False)
     @property
     def gain_loss_percent(self) -> float | None:
         """Calculate percentage gain/loss."""
         if self.current_price and self.cost_basis and self.cost_basis > 0:
-            return float((self.current_price - self.cost_basis) / self.cost_basis * 100)
+            return (self.current_price - self.cost_basis) / self.cost_basis * 100
         return None
 
 
@@ -143,6 +152,19 @@ class StockAnalysis(BaseModel):
     risk_factors: list[str] = Field(default_factory=list)
 
 
+@dataclass(frozen=True)
+class _Totals:
+    """Portfolio aggregates precomputed by :meth:`Portfolio.finalize`."""
+
+    # The finalized list itself (not its id(), which can be reused once it is collected)
+    holdings: list[StockHolding]
+    holdings_count: int
+    total_value: float
+    total_cost: float
+    allocation: dict[str, float]
+    sector_allocation: dict[str, float]
+
+
 class Portfolio(BaseModel):
     """Represents an investment portfolio."""
 
@@ -150,24 +172,81 @@ class Portfolio(BaseModel):
     holdings: list[StockHolding] = Field(default_factory=list)
     created_at: datetime = Field(default_factory=datetime.now)
 
+    _totals: _Totals | None = PrivateAttr(default=None)
+
+    def finalize(self) -> None:
+        """Precompute aggregates once holdings have been enriched.
+
+        Totals and allocations are served from this snapshot afterwards. Replacing or
+        resizing the holdings list discards it automatically; call this again after
+        updating holdings in place.
+        """
+        holdings = self.holdings
+        n = len(holdings)
+
+        # Structure-of-arrays view of the holdings so each aggregate is one vectorized pass
+        shares = np.fromiter((h.shares for h in holdings), dtype=np.float64, count=n)
+        prices = np.fromiter((h.current_price or 0.0 for h in holdings), dtype=np.float64, count=n)
+        costs = np.fromiter((h.cost_basis or 0.0 for h in holdings), dtype=np.float64, count=n)
+        sector_codes: dict[str, int] = {}
+        sector_idx = np.fromiter(
+            (sector_codes.setdefault(h.sector or "Unknown", len(sector_codes)) for h in holdings),
+            dtype=np.intp,
+            count=n,
+        )
+
+        values = shares * prices
+        total_value = float(values.sum())
+        allocation: dict[str, float] = {}
+        sector_allocation: dict[str, float] = {}
+        if total_value != 0:
+            allocation = dict(zip((h.symbol for h in holdings), (values / total_value * 100).tolist(), strict=True))
+            sector_values = np.bincount(sector_idx, weights=values, minlength=len(sector_codes))
+            sector_allocation = dict(zip(sector_codes, (sector_values / total_value * 100).tolist(), strict=True))
+
+        self._totals = _Totals(
+            holdings=holdings,
+            holdings_count=n,
+            total_value=total_value,
+            total_cost=float(np.dot(shares, costs)),
+            allocation=allocation,
+            sector_allocation=sector_allocation,
+        )
+
+    def _snapshot(self) -> _Totals | None:
+        """Get the finalized totals if the holdings list is unchanged since finalize()."""
+        totals = self._totals
+        if totals is not None and totals.holdings is self.holdings and totals.holdings_count == len(self.holdings):
+            return totals
+        return None
+
     @computed_field
     @property
-    def total_value(self) -> Decimal:
+    def total_value(self) -> float:
         """Calculate total portfolio value."""
-        return sum((h.current_value or Decimal("0") for h in self.holdings), Decimal("0"))
+        totals = self._snapshot()
+        if totals is not None:
+            return totals.total_value
+        holdings = self.holdings
+        values = np.fromiter((h.current_value or 0.0 for h in holdings), dtype=np.float64, count=len(holdings))
+        return float(values.sum())
 
     @computed_field
     @property
-    def total_cost(self) -> Decimal:
+    def total_cost(self) -> float:
         """Calculate total cost basis."""
-        return sum(
-            (h.cost_basis * h.shares if h.cost_basis else Decimal("0") for h in self.holdings),
-            Decimal("0"),
+        totals = self._snapshot()
+        if totals is not None:
+            return totals.total_cost
+        holdings = self.holdings
+        costs = np.fromiter(
+            (h.cost_basis * h.shares if h.cost_basis else 0.0 for h in holdings), dtype=np.float64, count=len(holdings)
         )
+        return float(costs.sum())
 
     @computed_field
     @property
-    def total_gain_loss(self) -> Decimal:
+    def total_gain_loss(self) -> float:
         """Calculate total unrealized gain/loss."""
         return self.total_value - self.total_cost
 
@@ -175,25 +254,34 @@ class Portfolio(BaseModel):
     @property
     def total_gain_loss_percent(self) -> float:
         """Calculate total percentage gain/loss."""
-        if self.total_cost > 0:
-            return float(self.total_gain_loss / self.total_cost * 100)
+        total_cost = self.total_cost
+        if total_cost > 0:
+            return (self.total_value - total_cost) / total_cost * 100
         return 0.0
 
     def get_allocation(self) -> dict[str, float]:
         """Get percentage allocation for each holding."""
-        if self.total_value == 0:
+        totals = self._snapshot()
+        if totals is not None:
+            return dict(totals.allocation)
+        total_value = self.total_value
+        if total_value == 0:
             return {}
-        return {h.symbol: float((h.current_value or Decimal("0")) / self.total_value * 100) for h in self.holdings}
+        return {h.symbol: (h.current_value or 0.0) / total_value * 100 for h in self.holdings}
 
     def get_sector_allocation(self) -> dict[str, float]:
         """Get percentage allocation by sector."""
-        if self.total_value == 0:
+        totals = self._snapshot()
+        if totals is not None:
+            return dict(totals.sector_allocation)
+        total_value = self.total_value
+        if total_value == 0:
             return {}
-        sector_values: dict[str, Decimal] = {}
+        sector_values: dict[str, float] = {}
         for h in self.holdings:
             sector = h.sector or "Unknown"
-            sector_values[sector] = sector_values.get(sector, Decimal("0")) + (h.current_value or Decimal("0"))
-        return {sector: float(value / self.total_value * 100) for sector, value in sector_values.items()}
+            sector_values[sector] = sector_values.get(sector, 0.0) + (h.current_value or 0.0)
+        return {sector: value / total_value * 100 for sector, value in sector_values.items()}
 
 
 class PortfolioAnalysis(BaseModel):
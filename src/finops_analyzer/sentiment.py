@@ -1,17 +1,31 @@
 """AI-powered sentiment analyzer using OpenAI or Anthropic."""
 
+import io
 import json
 import logging
+import re
+import time
 from datetime import datetime, timedelta
+from typing import Any
 
-import httpx
-from diskcache import Cache
+import orjson
+from pydantic import TypeAdapter
 
-from .config import AIProvider, get_settings
+from .cache import get_cache, make_key
+from .config import AIProvider, SentimentBackend, get_settings
+from .http_client import get_http_client
 from .models import NewsArticle, SentimentScore, StockAnalysis
 
 logger = logging.getLogger(__name__)
 
+_JSON_DECODER = json.JSONDecoder()
+
+# Compiled once and reused for serializing cached article lists
+_ARTICLES_ADAPTER = TypeAdapter(list[NewsArticle])
+
+# Populated per analysis run, so never written to the news cache
+_ARTICLE_ANALYSIS_FIELDS = {"__all__": {"sentiment", "sentiment_reasoning", "key_points"}}
+
 
 # System prompt for sentiment analysis
 SENTIMENT_SYSTEM_PROMPT = """You are a senior financial analyst specializing in stock market sentiment analysis.
@@ -46,6 +60,50 @@ Respond with a JSON object in this exact format:
 Valid sentiment values: very_bearish, bearish, neutral, bullish, very_bullish"""
 
 
+SENTIMENT_BULK_USER_PROMPT = """Analyze the sentiment of the news articles for each of these stocks:
+
+{articles_text}
+
+Respond with a JSON object with one result per stock symbol in this exact format:
+{{
+    "results": {{
+        "AAPL": {{
+            "articles": [
+                {{
+                    "index": 0,
+                    "sentiment": "bullish",
+                    "reasoning": "Brief explanation",
+                    "key_points": ["point 1", "point 2"]
+                }}
+            ],
+            "overall_sentiment": "bullish",
+            "summary": "2-3 sentence summary of the overall news sentiment for the stock"
+        }}
+    }}
+}}
+
+Article indexes restart at 0 under each stock heading.
+
+Include an entry for every symbol: {symbols}
+Valid sentiment values: very_bearish, bearish, neutral, bullish, very_bullish"""
+
+
+# Output token estimate for sentiment responses: a summary per stock plus an entry per article
+SENTIMENT_TOKENS_PER_STOCK = 200
+SENTIMENT_TOKENS_PER_ARTICLE = 150
+
+# max_tokens for Anthropic requests (which require an explicit cap) and the most a bulk call may ask for
+DEFAULT_MAX_TOKENS = 2048
+MAX_OUTPUT_TOKENS = 8192
+
+# Consecutive failed status checks after which a submitted batch is no longer polled
+BATCH_MAX_POLL_ERRORS = 5
+
+
+# FinBERT confidence above which a positive/negative label counts as "very" bullish/bearish
+FINBERT_STRONG_CONFIDENCE = 0.9
+
+
 PORTFOLIO_INSIGHTS_PROMPT = """You are a senior portfolio manager providing analysis for a retail investor.
 
 Portfolio Summary:
@@ -73,50 +131,87 @@ class NewsFetcher:
     """Fetches financial news for stocks."""
 
     def __init__(self):
-        self.settings = get_settings()
-        if self.settings.cache_enabled:
-            self.settings.cache_dir.mkdir(parents=True, exist_ok=True)
-            self._cache = Cache(str(self.settings.cache_dir / "news"))
-        else:
-            self._cache = None
+        settings = get_settings()
+        self._cache = get_cache()
+        self._ttl = settings.cache_ttl_seconds
+        self._news_count = settings.sentiment_news_count
+        self._newsapi_key = settings.newsapi_key
 
     def fetch_news(self, symbol: str) -> list[NewsArticle]:
         """Fetch news articles for a stock symbol."""
         cache_key = f"news_{symbol}"
-        if self._cache:
+        if self._cache is not None:
             cached = self._cache.get(cache_key)
             if cached:
-                return [NewsArticle(**a) for a in cached]
+                return self._articles_from_cache(cached[: self._news_count])
 
         articles = []
 
         # Try NewsAPI if key is available
-        if self.settings.newsapi_key:
+        if self._newsapi_key:
             articles = self._fetch_from_newsapi(symbol)
 
         # Fallback: Use yfinance news (free, no API key)
         if not articles:
             articles = self._fetch_from_yfinance(symbol)
 
-        if self._cache and articles:
+        if self._cache is not None and articles:
             self._cache.set(
                 cache_key,
-                [a.model_dump() for a in articles],
-                expire=self.settings.cache_ttl_seconds,
+                _ARTICLES_ADAPTER.dump_python(articles, exclude=_ARTICLE_ANALYSIS_FIELDS),
+                expire=self._ttl,
             )
 
-        return articles[: self.settings.sentiment_news_count]
+        return articles[: self._news_count]
+
+    def fetch_news_bulk(self, symbols: list[str]) -> dict[str, list[NewsArticle]]:
+        """Fetch news for several symbols, using a single NewsAPI request for cache misses.
+
+        Symbols explicitly mentioned by at least one article of the combined query are
+        kept and cached; symbols that are neither cached nor mentioned are left out of the
+        result so the caller can top them up with :meth:`fetch_news`.
+        """
+        results: dict[str, list[NewsArticle]] = {}
+        missing = []
+        for symbol in dict.fromkeys(symbols):
+            cached = self._cache.get(f"news_{symbol}") if self._cache is not None else None
+            if cached:
+                results[symbol] = self._articles_from_cache(cached[: self._news_count])
+            else:
+                missing.append(symbol)
+
+        if len(missing) > 1 and self._newsapi_key:
+            for symbol, articles in self._fetch_bulk_from_newsapi(missing).items():
+                if self._cache is not None:
+                    self._cache.set(
+                        f"news_{symbol}",
+                        _ARTICLES_ADAPTER.dump_python(articles, exclude=_ARTICLE_ANALYSIS_FIELDS),
+                        expire=self._ttl,
+                    )
+                results[symbol] = articles[: self._news_count]
+
+        return results
+
+    @staticmethod
+    def _articles_from_cache(cached: list[dict]) -> list[NewsArticle]:
+        """Rebuild cached articles without re-validating them.
+
+        The payload was dumped from validated models (minus the analysis fields), so
+        ``model_construct`` is safe and skips the validator entirely.
+        """
+        return [NewsArticle.model_construct(**article) for article in cached]
 
     def _fetch_from_yfinance(self, symbol: str) -> list[NewsArticle]:
         """Fetch news using yfinance (free)."""
-        import yfinance as yf
+        from .stock_fetcher import get_stock_fetcher
 
         try:
-            ticker = yf.Ticker(symbol)
+            # Reuse the ticker (and its HTTP session) opened while fetching market data
+            ticker = get_stock_fetcher().ticker(symbol)
             news_items = ticker.news or []
 
             articles = []
-            for item in news_items[: self.settings.sentiment_news_count]:
+            for item in news_items[: self._news_count]:
                 articles.append(
                     NewsArticle(
                         title=item.get("title", ""),
@@ -134,7 +229,7 @@ class NewsFetcher:
 
     def _fetch_from_newsapi(self, symbol: str) -> list[NewsArticle]:
         """Fetch news from NewsAPI.org (requires API key)."""
-        if not self.settings.newsapi_key:
+        if not self._newsapi_key:
             return []
 
         try:
@@ -145,39 +240,85 @@ class NewsFetcher:
                 "from": from_date,
                 "sortBy": "relevancy",
                 "language": "en",
-                "pageSize": self.settings.sentiment_news_count,
-                "apiKey": self.settings.newsapi_key.get_secret_value(),
+                "pageSize": self._news_count,
+                "apiKey": self._newsapi_key.get_secret_value(),
             }
 
-            response = httpx.get(url, params=params, timeout=10)
+            response = get_http_client().get(url, params=params)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
-            articles = []
-            for item in data.get("articles", []):
-                articles.append(
-                    NewsArticle(
-                        title=item.get("title", ""),
-                        description=item.get("description", ""),
-                        source=item.get("source", {}).get("name", "Unknown"),
-                        url=item.get("url", ""),
-                        published_at=datetime.fromisoformat(item.get("publishedAt", "").replace("Z", "+00:00")),
-                        symbol=symbol,
-                    )
-                )
-            return articles
+            return [self._newsapi_article(item, symbol) for item in data.get("articles", [])]
         except Exception as e:
             logger.error(f"Error fetching NewsAPI news for {symbol}: {e}")
             return []
 
+    def _fetch_bulk_from_newsapi(self, symbols: list[str]) -> dict[str, list[NewsArticle]]:
+        """Fetch news for several symbols with one NewsAPI query, split by mentioned ticker."""
+        if not self._newsapi_key:
+            return {}
+
+        try:
+            from_date = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
+            url = "https://newsapi.org/v2/everything"
+            params = {
+                "q": f"({' OR '.join(symbols)}) stock",
+                "from": from_date,
+                "sortBy": "relevancy",
+                "language": "en",
+                "pageSize": min(100, self._news_count * len(symbols)),
+                "apiKey": self._newsapi_key.get_secret_value(),
+            }
+
+            response = get_http_client().get(url, params=params)
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+
+            pattern = self._ticker_mention_pattern(symbols)
+            articles: dict[str, list[NewsArticle]] = {}
+            for item in data.get("articles", []):
+                text = f"{item.get('title') or ''} {item.get('description') or ''}"
+                mentioned = (match.group(1) or match.group(2) for match in pattern.finditer(text))
+                for symbol in dict.fromkeys(mentioned):
+                    articles.setdefault(symbol, []).append(self._newsapi_article(item, symbol))
+            return articles
+        except Exception as e:
+            logger.error(f"Error fetching NewsAPI news for {', '.join(symbols)}: {e}")
+            return {}
+
+    @staticmethod
+    def _ticker_mention_pattern(symbols: list[str]) -> re.Pattern[str]:
+        """Match explicit ticker mentions: ``$AAPL``, ``(AAPL)`` or ``(NASDAQ: AAPL)``.
+
+        Bare words are not treated as mentions, since short tickers such as ``T`` or
+        ``ON`` collide with ordinary text ("T-Mobile", "AT&T", "event ON Sept. 9").
+        """
+        alternatives = "|".join(re.escape(s) for s in sorted(symbols, key=len, reverse=True))
+        return re.compile(rf"\$({alternatives})\b|\((?:[A-Za-z]+:\s*)?({alternatives})\)")
+
+    @staticmethod
+    def _newsapi_article(item: dict, symbol: str) -> NewsArticle:
+        """Build a NewsArticle from a NewsAPI result item."""
+        return NewsArticle(
+            title=item.get("title", ""),
+            description=item.get("description", ""),
+            source=item.get("source", {}).get("name", "Unknown"),
+            url=item.get("url", ""),
+            published_at=datetime.fromisoformat(item.get("publishedAt", "").replace("Z", "+00:00")),
+            symbol=symbol,
+        )
+
 
 class AIAnalyzer:
     """AI-powered analysis using OpenAI or Anthropic."""
 
     def __init__(self):
         self.settings = get_settings()
+        self._cache = get_cache()
+        self._ttl = self.settings.cache_ttl_seconds
         self._openai_client = None
         self._anthropic_client = None
+        self._finbert = None
 
     @property
     def openai_client(self):
@@ -201,24 +342,89 @@ class AIAnalyzer:
                 self._anthropic_client = Anthropic(api_key=api_key.get_secret_value())
         return self._anthropic_client
 
-    def _call_ai(self, system_prompt: str, user_prompt: str) -> str | None:
-        """Call the configured AI provider."""
+    @property
+    def finbert(self):
+        """Lazy load the local FinBERT classification pipeline."""
+        if self._finbert is None:
+            from transformers import pipeline
+
+            if self.settings.finbert_quantized:
+                model, tokenizer = self._load_quantized_finbert()
+                self._finbert = pipeline("text-classification", model=model, tokenizer=tokenizer, device=-1)
+            else:
+                self._finbert = pipeline("text-classification", model=self.settings.finbert_model, device=-1)
+        return self._finbert
+
+    def _load_quantized_finbert(self):
+        """Load FinBERT as a dynamic int8 ONNX model, exporting and quantizing it on first use."""
+        from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        from transformers import AutoTokenizer
+
+        model_name = self.settings.finbert_model
+        model_dir = self.settings.cache_dir / "models" / f"{model_name.replace('/', '--')}-int8"
+
+        if not (model_dir / "model_quantized.onnx").exists():
+            logger.info(f"Exporting {model_name} to int8 ONNX in {model_dir}")
+            onnx_dir = model_dir.with_name(f"{model_name.replace('/', '--')}-onnx")
+            ORTModelForSequenceClassification.from_pretrained(model_name, export=True).save_pretrained(onnx_dir)
+            ORTQuantizer.from_pretrained(onnx_dir).quantize(
+                save_dir=model_dir,
+                quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False),
+            )
+            AutoTokenizer.from_pretrained(model_name).save_pretrained(model_dir)
+
+        model = ORTModelForSequenceClassification.from_pretrained(model_dir, file_name="model_quantized.onnx")
+        return model, AutoTokenizer.from_pretrained(model_dir)
+
+    def _response_cache_key(self, system_prompt: str, user_prompt: str) -> str:
+        """Build the cache key for an AI response to the given prompts."""
+        return make_key(
+            "ai", self.settings.ai_provider.value, self.settings.get_active_model(), system_prompt, user_prompt
+        )
+
+    def _call_ai(self, system_prompt: str, user_prompt: str, max_tokens: int = DEFAULT_MAX_TOKENS) -> str | None:
+        """Call the configured AI provider, reusing cached responses for identical prompts."""
+        cache_key = self._response_cache_key(system_prompt, user_prompt)
+        if self._cache is not None:
+            cached = self._cache.get(cache_key)
+            if cached:
+                logger.debug("Cache hit for AI response")
+                return cached
+
         try:
             if self.settings.ai_provider == AIProvider.OPENAI:
-                return self._call_openai(system_prompt, user_prompt)
+                response = self._call_openai(system_prompt, user_prompt)
             else:
-                return self._call_anthropic(system_prompt, user_prompt)
+                response = self._call_anthropic(system_prompt, user_prompt, max_tokens)
         except Exception as e:
             logger.error(f"AI API call failed: {e}")
             return None
 
+        self._cache_response(cache_key, response)
+        return response
+
+    def _cache_response(self, cache_key: str, response: str | None) -> None:
+        """Cache a response only if it holds a parseable JSON object.
+
+        Truncated or malformed replies are left uncached so the next run retries them.
+        """
+        if self._cache is None or not response:
+            return
+        try:
+            self._parse_json(response)
+        except json.JSONDecodeError:
+            logger.warning("Not caching unparseable AI response")
+            return
+        self._cache.set(cache_key, response, expire=self._ttl)
+
     def _call_openai(self, system_prompt: str, user_prompt: str) -> str | None:
         """Call OpenAI API."""
         if not self.openai_client:
             logger.warning("OpenAI client not configured")
             return None
 
-        response = self.openai_client.chat.completions.create(
+        stream = self.openai_client.chat.completions.create(
             model=self.settings.openai_model,
             messages=[
                 {"role": "system", "content": system_prompt},
@@ -226,22 +432,206 @@ class AIAnalyzer:
             ],
             temperature=0.3,
             response_format={"type": "json_object"},
+            stream=True,
         )
-        return response.choices[0].message.content
 
-    def _call_anthropic(self, system_prompt: str, user_prompt: str) -> str | None:
+        buffer = io.StringIO()
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                buffer.write(chunk.choices[0].delta.content)
+        return buffer.getvalue()
+
+    def _call_anthropic(
+        self, system_prompt: str, user_prompt: str, max_tokens: int = DEFAULT_MAX_TOKENS
+    ) -> str | None:
         """Call Anthropic API."""
         if not self.anthropic_client:
             logger.warning("Anthropic client not configured")
             return None
 
-        response = self.anthropic_client.messages.create(
+        buffer = io.StringIO()
+        with self.anthropic_client.messages.stream(
             model=self.settings.anthropic_model,
-            max_tokens=2048,
+            max_tokens=max_tokens,
             system=system_prompt,
             messages=[{"role": "user", "content": user_prompt}],
+        ) as stream:
+            for text in stream.text_stream:
+                buffer.write(text)
+        return buffer.getvalue()
+
+    def submit_batch(self, system_prompt: str, prompts: list[tuple[str, str]]) -> str | None:
+        """Submit ``(custom_id, user_prompt)`` pairs to the provider's batch API.
+
+        Batch requests are billed at a discount and run outside the interactive rate
+        limits, at the cost of completing asynchronously. Returns the batch id.
+        """
+        try:
+            if self.settings.ai_provider == AIProvider.OPENAI:
+                return self._submit_openai_batch(system_prompt, prompts)
+            return self._submit_anthropic_batch(system_prompt, prompts)
+        except Exception as e:
+            logger.error(f"AI batch submission failed: {e}")
+            return None
+
+    def fetch_batch(self, batch_id: str) -> dict[str, str] | None:
+        """Fetch batch results keyed by custom id, or None while the batch is still running.
+
+        A batch that ended without output yields an empty dict. Errors while polling
+        are raised so the caller can retry instead of abandoning a running batch.
+        """
+        if self.settings.ai_provider == AIProvider.OPENAI:
+            return self._fetch_openai_batch(batch_id)
+        return self._fetch_anthropic_batch(batch_id)
+
+    def _submit_openai_batch(self, system_prompt: str, prompts: list[tuple[str, str]]) -> str | None:
+        """Upload a JSONL request file and create an OpenAI batch."""
+        if not self.openai_client:
+            logger.warning("OpenAI client not configured")
+            return None
+
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": self.settings.openai_model,
+                        "messages": [
+                            {"role": "system", "content": system_prompt},
+                            {"role": "user", "content": user_prompt},
+                        ],
+                        "temperature": 0.3,
+                        "response_format": {"type": "json_object"},
+                    },
+                }
+            )
+            for custom_id, user_prompt in prompts
+        ]
+        batch_file = self.openai_client.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode("utf-8")), purpose="batch"
         )
-        return response.content[0].text
+        batch = self.openai_client.batches.create(
+            input_file_id=batch_file.id, endpoint="/v1/chat/completions", completion_window="24h"
+        )
+        return batch.id
+
+    def _fetch_openai_batch(self, batch_id: str) -> dict[str, str] | None:
+        """Poll an OpenAI batch and download its output file once complete."""
+        batch = self.openai_client.batches.retrieve(batch_id)
+        if batch.status in ("validating", "in_progress", "finalizing"):
+            return None
+        if batch.status != "completed" or not batch.output_file_id:
+            logger.error(f"AI batch {batch_id} ended with status {batch.status}")
+            return {}
+
+        results = {}
+        for line in self.openai_client.files.content(batch.output_file_id).text.splitlines():
+            item = orjson.loads(line)
+            choices = ((item.get("response") or {}).get("body") or {}).get("choices") or []
+            if choices:
+                results[item["custom_id"]] = choices[0]["message"]["content"]
+        return results
+
+    def _submit_anthropic_batch(self, system_prompt: str, prompts: list[tuple[str, str]]) -> str | None:
+        """Create an Anthropic message batch."""
+        if not self.anthropic_client:
+            logger.warning("Anthropic client not configured")
+            return None
+
+        batch = self.anthropic_client.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": custom_id,
+                    "params": {
+                        "model": self.settings.anthropic_model,
+                        "max_tokens": DEFAULT_MAX_TOKENS,
+                        "system": system_prompt,
+                        "messages": [{"role": "user", "content": user_prompt}],
+                    },
+                }
+                for custom_id, user_prompt in prompts
+            ]
+        )
+        return batch.id
+
+    def _fetch_anthropic_batch(self, batch_id: str) -> dict[str, str] | None:
+        """Poll an Anthropic message batch and collect succeeded results once ended."""
+        batch = self.anthropic_client.messages.batches.retrieve(batch_id)
+        if batch.processing_status != "ended":
+            return None
+
+        results = {}
+        for entry in self.anthropic_client.messages.batches.results(batch_id):
+            if entry.result.type == "succeeded":
+                results[entry.custom_id] = entry.result.message.content[0].text
+        return results
+
+    def _call_ai_batch(self, system_prompt: str, user_prompts: list[str]) -> list[str | None]:
+        """Run prompts through the batch API and wait for the results.
+
+        Cached responses are reused and only the remaining prompts are submitted.
+        Status checks that fail are retried until the deadline, unless
+        ``BATCH_MAX_POLL_ERRORS`` fail in a row. Returns responses in prompt order,
+        with None for prompts that did not complete.
+        """
+        responses: list[str | None] = [None] * len(user_prompts)
+        cache_keys = [self._response_cache_key(system_prompt, prompt) for prompt in user_prompts]
+        pending = []
+        for i, cache_key in enumerate(cache_keys):
+            cached = self._cache.get(cache_key) if self._cache is not None else None
+            if cached:
+                responses[i] = cached
+            else:
+                pending.append((f"request-{i}", user_prompts[i]))
+
+        if not pending:
+            return responses
+
+        batch_id = self.submit_batch(system_prompt, pending)
+        if not batch_id:
+            return responses
+
+        logger.info(f"Submitted AI batch {batch_id} with {len(pending)} requests")
+        deadline = time.monotonic() + self.settings.batch_timeout_seconds
+        poll_interval = self.settings.batch_poll_interval_seconds
+        errors = 0
+        while True:
+            try:
+                results = self.fetch_batch(batch_id)
+                errors = 0
+            except Exception as e:
+                errors += 1
+                logger.warning(f"Failed to poll AI batch {batch_id} ({errors}/{BATCH_MAX_POLL_ERRORS}): {e}")
+                if errors >= BATCH_MAX_POLL_ERRORS:
+                    logger.error(f"Gave up polling AI batch {batch_id}; results were not collected")
+                    return responses
+                results = None
+            if results is not None:
+                break
+            if time.monotonic() >= deadline:
+                logger.warning(f"AI batch {batch_id} still running; results were not collected")
+                return responses
+            time.sleep(poll_interval)
+
+        for custom_id, _ in pending:
+            i = int(custom_id.removeprefix("request-"))
+            responses[i] = results.get(custom_id)
+            self._cache_response(cache_keys[i], responses[i])
+        return responses
+
+    @staticmethod
+    def _parse_json(response: str) -> Any:
+        """Decode the JSON object in an AI response, ignoring any text around it."""
+        start = response.find("{")
+        if start < 0:
+            raise json.JSONDecodeError("No JSON object found", response, 0)
+        try:
+            return orjson.loads(response[start : response.rfind("}") + 1])
+        except orjson.JSONDecodeError:
+            # Trailing prose containing braces; fall back to scanning for the first object
+            return _JSON_DECODER.raw_decode(response, start)[0]
 
     def analyze_sentiment(
         self, symbol: str, articles: list[NewsArticle]
@@ -250,15 +640,10 @@ class AIAnalyzer:
         if not articles:
             return articles, None, None
 
-        # Prepare articles text
-        articles_text = "\n\n".join(
-            [
-                f"[Article {i}]\nTitle: {a.title}\nSource: {a.source}\nDate: {a.published_at.strftime('%Y-%m-%d')}\nDescription: {a.description or 'N/A'}"
-                for i, a in enumerate(articles)
-            ]
-        )
+        if self.settings.sentiment_backend == SentimentBackend.FINBERT:
+            return self.analyze_sentiment_finbert({symbol: articles}).get(symbol, (articles, None, None))
 
-        user_prompt = SENTIMENT_USER_PROMPT.format(symbol=symbol, articles_text=articles_text)
+        user_prompt = SENTIMENT_USER_PROMPT.format(symbol=symbol, articles_text=self._format_articles(articles))
 
         response = self._call_ai(SENTIMENT_SYSTEM_PROMPT, user_prompt)
 
@@ -267,43 +652,221 @@ class AIAnalyzer:
 
         try:
             # Parse JSON response
-            data = json.loads(response)
+            data = self._parse_json(response)
+            return self._apply_sentiment(articles, data)
 
-            # Update articles with sentiment
-            for article_data in data.get("articles", []):
-                idx = article_data.get("index", 0)
-                if 0 <= idx < len(articles):
-                    sentiment_str = article_data.get("sentiment", "neutral")
-                    articles[idx].sentiment = SentimentScore(sentiment_str)
-                    articles[idx].sentiment_reasoning = article_data.get("reasoning")
-                    articles[idx].key_points = article_data.get("key_points", [])
+        except (json.JSONDecodeError, ValueError, TypeError, AttributeError) as e:
+            logger.error(f"Failed to parse AI response: {e}")
+            return articles, None, None
 
-            overall = SentimentScore(data.get("overall_sentiment", "neutral"))
-            summary = data.get("summary")
+    def analyze_sentiment_bulk(
+        self, payload: dict[str, list[NewsArticle]]
+    ) -> dict[str, tuple[list[NewsArticle], SentimentScore | None, str | None]]:
+        """Analyze sentiment for several stocks, batching them into shared AI calls.
+
+        Stocks are sent ``sentiment_batch_size`` at a time so each call stays small
+        enough for reliable per-stock results. Symbols whose entry is missing or
+        malformed in the response are left out of the result so the caller can fall
+        back to :meth:`analyze_sentiment`.
+        """
+        payload = {symbol: articles for symbol, articles in payload.items() if articles}
+        if not payload:
+            return {}
 
-            return articles, overall, summary
+        if self.settings.sentiment_backend == SentimentBackend.FINBERT:
+            return self.analyze_sentiment_finbert(payload)
+
+        if self.settings.batch_mode:
+            return self._analyze_sentiment_via_batch_api(payload)
+
+        if len(payload) == 1:
+            symbol, articles = next(iter(payload.items()))
+            return {symbol: self.analyze_sentiment(symbol, articles)}
+
+        # Close a batch at sentiment_batch_size stocks or once its response would exceed the output cap
+        batch_size = max(1, self.settings.sentiment_batch_size)
+        results = {}
+        batch: dict[str, list[NewsArticle]] = {}
+        batch_tokens = 0
+        for symbol, articles in payload.items():
+            tokens = self._sentiment_output_tokens({symbol: articles})
+            if batch and (len(batch) >= batch_size or batch_tokens + tokens > MAX_OUTPUT_TOKENS):
+                results.update(self._analyze_sentiment_batch(batch))
+                batch, batch_tokens = {}, 0
+            batch[symbol] = articles
+            batch_tokens += tokens
+        if batch:
+            results.update(self._analyze_sentiment_batch(batch))
+        return results
+
+    def _analyze_sentiment_batch(
+        self, payload: dict[str, list[NewsArticle]]
+    ) -> dict[str, tuple[list[NewsArticle], SentimentScore | None, str | None]]:
+        """Analyze sentiment for one batch of stocks with a single AI call."""
+        articles_text = "\n\n".join(
+            f"## {symbol}\n{self._format_articles(articles)}" for symbol, articles in payload.items()
+        )
+        user_prompt = SENTIMENT_BULK_USER_PROMPT.format(articles_text=articles_text, symbols=", ".join(payload))
+        max_tokens = min(MAX_OUTPUT_TOKENS, max(DEFAULT_MAX_TOKENS, self._sentiment_output_tokens(payload)))
 
-        except (json.JSONDecodeError, ValueError) as e:
-            logger.error(f"Failed to parse AI response: {e}")
-            return articles, None, None
+        response = self._call_ai(SENTIMENT_SYSTEM_PROMPT, user_prompt, max_tokens=max_tokens)
+
+        if not response:
+            return {}
+
+        try:
+            data = self._parse_json(response)
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse bulk AI response: {e}")
+            return {}
+
+        results_data = data.get("results") if isinstance(data, dict) else None
+        if not isinstance(results_data, dict):
+            logger.error("Unexpected bulk AI response format")
+            return {}
+
+        results = {}
+        for symbol, articles in payload.items():
+            symbol_data = results_data.get(symbol)
+            if not isinstance(symbol_data, dict):
+                logger.warning(f"No sentiment returned for {symbol} in bulk response")
+                continue
+            try:
+                results[symbol] = self._apply_sentiment(articles, symbol_data)
+            except (ValueError, TypeError, AttributeError) as e:
+                logger.error(f"Failed to parse AI response for {symbol}: {e}")
+
+        return results
+
+    @staticmethod
+    def _sentiment_output_tokens(payload: dict[str, list[NewsArticle]]) -> int:
+        """Estimate the output tokens a sentiment response for these stocks needs."""
+        return sum(SENTIMENT_TOKENS_PER_STOCK + SENTIMENT_TOKENS_PER_ARTICLE * len(a) for a in payload.values())
+
+    def _analyze_sentiment_via_batch_api(
+        self, payload: dict[str, list[NewsArticle]]
+    ) -> dict[str, tuple[list[NewsArticle], SentimentScore | None, str | None]]:
+        """Analyze sentiment with one provider batch request per stock."""
+        symbols = list(payload)
+        user_prompts = [
+            SENTIMENT_USER_PROMPT.format(symbol=symbol, articles_text=self._format_articles(payload[symbol]))
+            for symbol in symbols
+        ]
+        responses = self._call_ai_batch(SENTIMENT_SYSTEM_PROMPT, user_prompts)
+
+        results = {}
+        for symbol, response in zip(symbols, responses, strict=True):
+            if not response:
+                continue
+            try:
+                results[symbol] = self._apply_sentiment(payload[symbol], self._parse_json(response))
+            except (json.JSONDecodeError, ValueError, TypeError, AttributeError) as e:
+                logger.error(f"Failed to parse AI batch response for {symbol}: {e}")
+        return results
+
+    def analyze_sentiment_finbert(
+        self, payload: dict[str, list[NewsArticle]]
+    ) -> dict[str, tuple[list[NewsArticle], SentimentScore | None, str | None]]:
+        """Classify articles for all symbols locally with FinBERT in one batched pass."""
+        texts = [
+            f"{a.title}. {a.description}" if a.description else a.title
+            for articles in payload.values()
+            for a in articles
+        ]
+        if not texts:
+            return {}
+
+        try:
+            predictions = iter(self.finbert(texts, batch_size=32, truncation=True))
+        except Exception as e:
+            logger.error(f"FinBERT sentiment analysis failed: {e}")
+            return {}
+
+        results = {}
+        for symbol, articles in payload.items():
+            counts = {"positive": 0, "neutral": 0, "negative": 0}
+            for article in articles:
+                prediction = next(predictions)
+                label = prediction["label"].lower()
+                counts[label] = counts.get(label, 0) + 1
+                article.sentiment = self._finbert_sentiment(label, prediction["score"])
+                article.sentiment_reasoning = f"FinBERT: {label} ({prediction['score']:.0%} confidence)"
+
+            average = sum(a.sentiment.score for a in articles) / len(articles)
+            summary = (
+                f"{counts['positive']} positive, {counts['neutral']} neutral and "
+                f"{counts['negative']} negative headlines for {symbol} (FinBERT)."
+            )
+            results[symbol] = (articles, self._sentiment_from_score(average), summary)
+
+        return results
+
+    @staticmethod
+    def _finbert_sentiment(label: str, confidence: float) -> SentimentScore:
+        """Map a FinBERT label and confidence onto the five-level sentiment scale."""
+        strong = confidence >= FINBERT_STRONG_CONFIDENCE
+        if label == "positive":
+            return SentimentScore.VERY_BULLISH if strong else SentimentScore.BULLISH
+        if label == "negative":
+            return SentimentScore.VERY_BEARISH if strong else SentimentScore.BEARISH
+        return SentimentScore.NEUTRAL
+
+    @staticmethod
+    def _sentiment_from_score(score: float) -> SentimentScore:
+        """Map an average sentiment score (-1 to 1) back onto the sentiment scale."""
+        if score >= 0.75:
+            return SentimentScore.VERY_BULLISH
+        if score >= 0.25:
+            return SentimentScore.BULLISH
+        if score > -0.25:
+            return SentimentScore.NEUTRAL
+        if score > -0.75:
+            return SentimentScore.BEARISH
+        return SentimentScore.VERY_BEARISH
+
+    @staticmethod
+    def _format_articles(articles: list[NewsArticle]) -> str:
+        """Format articles as numbered prompt text."""
+        return "\n\n".join(
+            [
+                f"[Article {i}]\nTitle: {a.title}\nSource: {a.source}\nDate: {a.published_at.strftime('%Y-%m-%d')}\nDescription: {a.description or 'N/A'}"
+                for i, a in enumerate(articles)
+            ]
+        )
+
+    @staticmethod
+    def _apply_sentiment(
+        articles: list[NewsArticle], data: dict
+    ) -> tuple[list[NewsArticle], SentimentScore | None, str | None]:
+        """Update articles from a parsed sentiment response and return the overall result."""
+        for article_data in data.get("articles", []):
+            idx = article_data.get("index", 0)
+            if 0 <= idx < len(articles):
+                sentiment_str = article_data.get("sentiment", "neutral")
+                articles[idx].sentiment = SentimentScore(sentiment_str)
+                articles[idx].sentiment_reasoning = article_data.get("reasoning")
+                articles[idx].key_points = article_data.get("key_points", [])
+
+        overall = SentimentScore(data.get("overall_sentiment", "neutral"))
+        summary = data.get("summary")
+
+        return articles, overall, summary
 
     def generate_portfolio_insights(self, portfolio_summary: str, stock_analyses: dict[str, StockAnalysis]) -> dict:
         """Generate AI insights for the entire portfolio."""
         # Format stock analyses
-        analyses_text = ""
+        parts = []
         for symbol, analysis in stock_analyses.items():
-            analyses_text += f"\n{symbol}:\n"
-            analyses_text += (
-                f"  - 30-day change: {analysis.price_change_30d:.1f}%\n" if analysis.price_change_30d else ""
-            )
-            analyses_text += f"  - Volatility: {analysis.volatility_30d:.1f}%\n" if analysis.volatility_30d else ""
-            analyses_text += f"  - RSI: {analysis.rsi_14:.1f}\n" if analysis.rsi_14 else ""
-            analyses_text += f"  - Risk: {analysis.risk_level.value if analysis.risk_level else 'Unknown'}\n"
-            analyses_text += (
-                f"  - Sentiment: {analysis.overall_sentiment.value if analysis.overall_sentiment else 'Unknown'}\n"
+            change = f"  - 30-day change: {analysis.price_change_30d:.1f}%\n" if analysis.price_change_30d else ""
+            volatility = f"  - Volatility: {analysis.volatility_30d:.1f}%\n" if analysis.volatility_30d else ""
+            rsi = f"  - RSI: {analysis.rsi_14:.1f}\n" if analysis.rsi_14 else ""
+            risk = analysis.risk_level.value if analysis.risk_level else "Unknown"
+            sentiment = analysis.overall_sentiment.value if analysis.overall_sentiment else "Unknown"
+            factors = f"  - Risk factors: {', '.join(analysis.risk_factors)}\n" if analysis.risk_factors else ""
+            parts.append(
+                f"\n{symbol}:\n{change}{volatility}{rsi}  - Risk: {risk}\n  - Sentiment: {sentiment}\n{factors}"
             )
-            if analysis.risk_factors:
-                analyses_text += f"  - Risk factors: {', '.join(analysis.risk_factors)}\n"
+        analyses_text = "".join(parts)
 
         user_prompt = PORTFOLIO_INSIGHTS_PROMPT.format(
             portfolio_summary=portfolio_summary, stock_analyses=analyses_text
@@ -315,7 +878,7 @@ class AIAnalyzer:
             return {}
 
         try:
-            return json.loads(response)
+            return self._parse_json(response)
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse portfolio insights: {e}")
             return {}
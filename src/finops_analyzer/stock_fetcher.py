@@ -2,28 +2,50 @@
 
 import logging
 from datetime import datetime, timedelta
-from decimal import Decimal
 
+import numpy as np
 import pandas as pd
 import yfinance as yf
-from diskcache import Cache
 
+from .cache import get_cache, memoize
 from .config import get_settings
 from .models import RiskLevel, StockAnalysis, StockHolding
 
+try:
+    from . import _kernels_aot as kernels
+except ImportError:
+    from . import _kernels as kernels
+
 logger = logging.getLogger(__name__)
 
+# History needed by analyze_stock (the 200-day moving average is the longest window)
+ANALYSIS_HISTORY_DAYS = 200
+
+
+# ``Ticker.fast_info`` attributes consumed by enrich_holding, keyed by their cached names
+FAST_INFO_FIELDS = {
+    "lastPrice": "last_price",
+    "marketCap": "market_cap",
+    "yearHigh": "year_high",
+    "yearLow": "year_low",
+}
+
+
+def _optional_float(value: object) -> float | None:
+    """Convert a yfinance numeric field to float, treating missing and zero values as unknown."""
+    return float(value) if value else None
+
 
 class StockDataFetcher:
     """Fetches stock data from Yahoo Finance with caching."""
 
     def __init__(self):
-        self.settings = get_settings()
-        if self.settings.cache_enabled:
-            self.settings.cache_dir.mkdir(parents=True, exist_ok=True)
-            self._cache = Cache(str(self.settings.cache_dir / "stock_data"))
-        else:
-            self._cache = None
+        settings = get_settings()
+        self._cache = get_cache()
+        self._ttl = settings.cache_ttl_seconds
+        self._profile_ttl = settings.profile_cache_ttl_seconds
+        self._default_period_days = settings.analysis_period_days
+        self._tickers: dict[str, yf.Ticker] = {}
 
     def _get_cached(self, key: str) -> dict | None:
         """Get value from cache if available."""
@@ -31,116 +53,254 @@ class StockDataFetcher:
             return None
         return self._cache.get(key)
 
-    def _set_cached(self, key: str, value: dict) -> None:
-        """Set value in cache."""
+    def _set_cached(self, key: str, value: dict, expire: int | None = None) -> None:
+        """Set value in cache, expiring after the market data TTL unless given."""
         if self._cache is not None:
-            self._cache.set(key, value, expire=self.settings.cache_ttl_seconds)
+            self._cache.set(key, value, expire=expire or self._ttl)
+
+    def open_tickers(self, symbols: list[str]) -> None:
+        """Share one yfinance ``Tickers`` session for subsequent lookups of these symbols."""
+        if symbols:
+            self._tickers.update(yf.Tickers(" ".join(symbols)).tickers)
+
+    def ticker(self, symbol: str) -> yf.Ticker:
+        """Get the shared ticker for a symbol, creating and keeping one for one-off lookups."""
+        ticker = self._tickers.get(symbol)
+        if ticker is None:
+            ticker = self._tickers.setdefault(symbol, yf.Ticker(symbol))
+        return ticker
+
+    @memoize()
+    def fetch_fast_info(self, symbol: str) -> dict:
+        """Fetch current price, market cap and 52-week range from the lightweight quote endpoint."""
+        cache_key = f"fast_info_{symbol}"
+        cached = self._get_cached(cache_key)
+        if cached:
+            logger.debug(f"Cache hit for {symbol} fast info")
+            return cached
+
+        logger.info(f"Fetching quote for {symbol}")
+        fast_info = self.ticker(symbol).fast_info
+        info = {}
+        for key, attribute in FAST_INFO_FIELDS.items():
+            try:
+                info[key] = _optional_float(getattr(fast_info, attribute))
+            except Exception as e:
+                logger.debug(f"No {attribute} in fast info for {symbol}: {e}")
+                info[key] = None
+
+        # Raising keeps a failed quote out of both the disk cache and the memo
+        if info["lastPrice"] is None:
+            raise ValueError(f"No quote price available for {symbol}")
+
+        self._set_cached(cache_key, info)
+        return info
 
+    @memoize()
     def fetch_stock_info(self, symbol: str) -> dict:
-        """Fetch current stock information."""
-        cache_key = f"info_{symbol}"
+        """Fetch the full quote summary, cached with the market data TTL."""
+        return self._fetch_info(symbol, f"info_{symbol}", self._ttl)
+
+    @memoize()
+    def fetch_full_info(self, symbol: str) -> dict:
+        """Fetch the full quote summary for profile fields (sector, industry, valuation ratios).
+
+        Cached for the longer profile TTL, so its price fields may be stale; use
+        :meth:`fetch_stock_info` when current market data is needed.
+        """
+        return self._fetch_info(symbol, f"full_info_{symbol}", self._profile_ttl)
+
+    def _fetch_info(self, symbol: str, cache_key: str, expire: int) -> dict:
+        """Get the full quote summary from the cache, fetching it on a miss."""
         cached = self._get_cached(cache_key)
         if cached:
             logger.debug(f"Cache hit for {symbol} info")
             return cached
 
         logger.info(f"Fetching stock info for {symbol}")
-        ticker = yf.Ticker(symbol)
+        ticker = self.ticker(symbol)
         info = ticker.info
 
-        self._set_cached(cache_key, info)
+        self._set_cached(cache_key, info, expire=expire)
         return info
 
+    @memoize()
     def fetch_history(self, symbol: str, period_days: int | None = None) -> pd.DataFrame:
-        """Fetch historical price data."""
-        period_days = period_days or self.settings.analysis_period_days
+        """Fetch historical closing prices as a date-indexed DataFrame."""
+        payload = self._history_payload(symbol, period_days)
+        index = pd.DatetimeIndex(np.frombuffer(payload["index"], dtype="datetime64[s]"))
+        return pd.DataFrame({"Close": np.frombuffer(payload["close"], dtype=np.float64)}, index=index)
+
+    @memoize()
+    def fetch_close_prices(self, symbol: str, period_days: int | None = None) -> np.ndarray:
+        """Fetch historical closing prices as a raw ``float64`` array, oldest first."""
+        payload = self._history_payload(symbol, period_days)
+        # Copy into a writable buffer; the AOT kernels are typed on mutable arrays
+        return np.frombuffer(bytearray(payload["close"]), dtype=np.float64)
+
+    def prefetch_history(self, symbols: list[str], period_days: int | None = None) -> None:
+        """Download history for several symbols in one request and store it in the cache.
+
+        Later :meth:`fetch_history` / :meth:`fetch_close_prices` calls for these symbols
+        are then cache reads. Does nothing when caching is disabled.
+        """
+        if self._cache is None:
+            return
+        period_days = period_days or self._default_period_days
+        missing = [s for s in dict.fromkeys(symbols) if self._get_cached(f"history_{s}_{period_days}") is None]
+        if len(missing) < 2:
+            return
+
+        logger.info(f"Prefetching {period_days}-day history for {len(missing)} symbols")
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=period_days)
+        try:
+            data = yf.download(
+                missing,
+                start=start_date,
+                end=end_date,
+                group_by="ticker",
+                auto_adjust=True,
+                threads=True,
+                progress=False,
+            )
+        except Exception as e:
+            logger.error(f"Error prefetching history: {e}")
+            return
+
+        downloaded = set(data.columns.get_level_values(0))
+        for symbol in missing:
+            if symbol not in downloaded:
+                continue
+            history = data[symbol].dropna(how="all")
+            # Leave symbols the batch request returned nothing for to the per-symbol path
+            if not history.empty:
+                self._set_cached(f"history_{symbol}_{period_days}", self._pack_history(history))
+
+    def _history_payload(self, symbol: str, period_days: int | None) -> dict:
+        """Get cached close prices and dates as raw buffers, downloading them on a miss."""
+        period_days = period_days or self._default_period_days
         cache_key = f"history_{symbol}_{period_days}"
         cached = self._get_cached(cache_key)
         if cached is not None:
             logger.debug(f"Cache hit for {symbol} history")
-            return pd.DataFrame(cached)
+            return cached
 
         logger.info(f"Fetching {period_days}-day history for {symbol}")
-        ticker = yf.Ticker(symbol)
+        ticker = self.ticker(symbol)
         end_date = datetime.now()
         start_date = end_date - timedelta(days=period_days)
 
         history = ticker.history(start=start_date, end=end_date)
 
-        self._set_cached(cache_key, history.to_dict())
-        return history
+        payload = self._pack_history(history)
+        self._set_cached(cache_key, payload)
+        return payload
+
+    @staticmethod
+    def _pack_history(history: pd.DataFrame) -> dict:
+        """Pack the close column and its dates into raw buffers for caching."""
+        if history.empty:
+            return {"close": b"", "index": b"", "n": 0}
+        index = history.index
+        if index.tz is not None:
+            index = index.tz_convert(None)
+        return {
+            "close": history["Close"].to_numpy(dtype=np.float64).tobytes(),
+            "index": index.to_numpy().astype("datetime64[s]").tobytes(),
+            "n": len(history),
+        }
 
     def enrich_holding(self, holding: StockHolding) -> StockHolding:
-        """Enrich a stock holding with current market data."""
+        """Enrich a stock holding with current market data.
+
+        On a cold profile cache, one fresh full summary supplies both the market data
+        and the profile, and is also stored as the profile. Otherwise the lightweight
+        quote is used, falling back to a fresh full summary if it fails.
+        """
         try:
-            info = self.fetch_stock_info(holding.symbol)
+            needs_profile = holding.sector is None or holding.company_name is None
+            info = None
+            if needs_profile and self._get_cached(f"full_info_{holding.symbol}") is None:
+                info = self.fetch_stock_info(holding.symbol)
+                self._set_cached(f"full_info_{holding.symbol}", info, expire=self._profile_ttl)
+                quote = self._quote_from_info(info)
+            else:
+                try:
+                    quote = self.fetch_fast_info(holding.symbol)
+                except Exception as e:
+                    # Fall back to a fresh full summary rather than the long-lived profile
+                    logger.warning(f"Quote unavailable for {holding.symbol}, using full stock info: {e}")
+                    info = self.fetch_stock_info(holding.symbol)
+                    quote = self._quote_from_info(info)
 
             # Update holding with fetched data
-            holding.current_price = Decimal(str(info.get("currentPrice", 0) or info.get("regularMarketPrice", 0)))
-            holding.company_name = info.get("longName") or info.get("shortName")
-            holding.sector = info.get("sector")
-            holding.industry = info.get("industry")
-            holding.market_cap = Decimal(str(info.get("marketCap", 0))) if info.get("marketCap") else None
-            holding.pe_ratio = info.get("trailingPE")
-            holding.dividend_yield = info.get("dividendYield")
-            holding.fifty_two_week_high = (
-                Decimal(str(info.get("fiftyTwoWeekHigh", 0))) if info.get("fiftyTwoWeekHigh") else None
-            )
-            holding.fifty_two_week_low = (
-                Decimal(str(info.get("fiftyTwoWeekLow", 0))) if info.get("fiftyTwoWeekLow") else None
-            )
+            holding.current_price = quote["lastPrice"] or 0.0
+            holding.market_cap = quote["marketCap"]
+            holding.fifty_two_week_high = quote["yearHigh"]
+            holding.fifty_two_week_low = quote["yearLow"]
+
+            # The profile is only needed for fields not populated yet
+            if needs_profile:
+                profile = info or self.fetch_full_info(holding.symbol)
+                holding.company_name = profile.get("longName") or profile.get("shortName")
+                holding.sector = profile.get("sector")
+                holding.industry = profile.get("industry")
+                holding.pe_ratio = profile.get("trailingPE")
+                holding.dividend_yield = profile.get("dividendYield")
 
         except Exception as e:
             logger.error(f"Error fetching data for {holding.symbol}: {e}")
 
         return holding
 
+    @staticmethod
+    def _quote_from_info(info: dict) -> dict:
+        """Extract the fast info quote fields from a full quote summary."""
+        return {
+            "lastPrice": _optional_float(info.get("currentPrice") or info.get("regularMarketPrice")),
+            "marketCap": _optional_float(info.get("marketCap")),
+            "yearHigh": _optional_float(info.get("fiftyTwoWeekHigh")),
+            "yearLow": _optional_float(info.get("fiftyTwoWeekLow")),
+        }
+
     def analyze_stock(self, symbol: str) -> StockAnalysis:
         """Generate technical analysis for a stock."""
         analysis = StockAnalysis(symbol=symbol)
 
         try:
-            # Fetch historical data
-            history = self.fetch_history(symbol, period_days=200)  # Need 200 days for 200-MA
+            # Fetch historical closing prices
+            prices = self.fetch_close_prices(symbol, period_days=ANALYSIS_HISTORY_DAYS)
+            n = len(prices)
 
-            if history.empty:
+            if n == 0:
                 logger.warning(f"No historical data available for {symbol}")
                 return analysis
 
-            close_prices = history["Close"]
+            current_price = prices[-1]
 
             # Price changes
-            if len(close_prices) >= 2:
-                analysis.price_change_1d = float(
-                    (close_prices.iloc[-1] - close_prices.iloc[-2]) / close_prices.iloc[-2] * 100
-                )
-
-            if len(close_prices) >= 7:
-                analysis.price_change_7d = float(
-                    (close_prices.iloc[-1] - close_prices.iloc[-7]) / close_prices.iloc[-7] * 100
-                )
-
-            if len(close_prices) >= 30:
-                analysis.price_change_30d = float(
-                    (close_prices.iloc[-1] - close_prices.iloc[-30]) / close_prices.iloc[-30] * 100
-                )
+            if n >= 2:
+                analysis.price_change_1d = float((current_price / prices[-2] - 1) * 100)
+
+            if n >= 7:
+                analysis.price_change_7d = float((current_price / prices[-7] - 1) * 100)
+
+            if n >= 30:
+                analysis.price_change_30d = float((current_price / prices[-30] - 1) * 100)
                 # 30-day volatility (annualized)
-                returns = close_prices.pct_change().dropna()
-                analysis.volatility_30d = float(returns.tail(30).std() * (252**0.5) * 100)
+                analysis.volatility_30d = float(kernels.volatility(prices, 30))
 
             # RSI calculation (14-day)
-            if len(close_prices) >= 15:
-                analysis.rsi_14 = self._calculate_rsi(close_prices, period=14)
+            if n >= 15:
+                analysis.rsi_14 = self._calculate_rsi(prices, period=14)
 
             # Moving averages
-            current_price = close_prices.iloc[-1]
-            if len(close_prices) >= 50:
-                ma_50 = close_prices.tail(50).mean()
-                analysis.above_50_ma = current_price > ma_50
+            if n >= 50:
+                analysis.above_50_ma = bool(current_price > kernels.moving_average(prices, 50))
 
-            if len(close_prices) >= 200:
-                ma_200 = close_prices.tail(200).mean()
-                analysis.above_200_ma = current_price > ma_200
+            if n >= 200:
+                analysis.above_200_ma = bool(current_price > kernels.moving_average(prices, 200))
 
             # Risk assessment
             analysis.risk_level, analysis.risk_factors = self._assess_risk(analysis)
@@ -150,15 +310,9 @@ class StockDataFetcher:
 
         return analysis
 
-    def _calculate_rsi(self, prices: pd.Series, period: int = 14) -> float:
+    def _calculate_rsi(self, prices: np.ndarray, period: int = 14) -> float:
         """Calculate Relative Strength Index."""
-        delta = prices.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        return float(rsi.iloc[-1])
+        return float(kernels.rsi(prices, period))
 
     def _assess_risk(self, analysis: StockAnalysis) -> tuple[RiskLevel, list[str]]:
         """Assess risk level based on technical indicators."""
@@ -0,0 +1,35 @@
+"""Shared test fixtures."""
+
+from datetime import datetime
+
+import pytest
+
+from finops_analyzer import cache, config
+from finops_analyzer.models import NewsArticle
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Point the settings and shared disk cache at a per-test directory instead of ~/.finops-analyzer."""
+    monkeypatch.setenv("FINOPS_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(config, "_settings", None)
+    monkeypatch.setattr(cache, "_cache", None)
+
+
+@pytest.fixture
+def make_articles():
+    """Factory for placeholder news articles about a symbol."""
+
+    def factory(symbol: str, count: int = 2) -> list[NewsArticle]:
+        return [
+            NewsArticle(
+                title=f"{symbol} headline {i}",
+                source="Test Wire",
+                url=f"https://example.com/{symbol}/{i}",
+                published_at=datetime(2024, 5, 1),
+                symbol=symbol,
+            )
+            for i in range(count)
+        ]
+
+    return factory
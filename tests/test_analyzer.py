@@ -0,0 +1,131 @@
+"""Tests for analyzer module."""
+
+import pytest
+from pydantic import SecretStr
+
+from finops_analyzer.analyzer import PortfolioAnalyzer
+from finops_analyzer.config import SentimentBackend
+from finops_analyzer.models import SentimentScore, StockHolding
+
+
+class StubNewsFetcher:
+    """News fetcher whose bulk request only covers some symbols."""
+
+    def __init__(self, bulk_symbols: set[str], make_articles):
+        self.bulk_symbols = bulk_symbols
+        self.make_articles = make_articles
+        self.fetched: list[str] = []
+
+    def fetch_news_bulk(self, symbols):
+        return {symbol: self.make_articles(symbol) for symbol in symbols if symbol in self.bulk_symbols}
+
+    def fetch_news(self, symbol):
+        self.fetched.append(symbol)
+        return self.make_articles(symbol)
+
+
+class StubAIAnalyzer:
+    """AI analyzer whose bulk call only answers for some symbols."""
+
+    def __init__(self, bulk_symbols: set[str]):
+        self.bulk_symbols = bulk_symbols
+        self.fallbacks: list[str] = []
+
+    def analyze_sentiment_bulk(self, news):
+        return {s: (news[s], SentimentScore.BULLISH, "bulk") for s in news if s in self.bulk_symbols}
+
+    def analyze_sentiment(self, symbol, articles):
+        self.fallbacks.append(symbol)
+        return articles, SentimentScore.NEUTRAL, "single"
+
+
+class TestLoadPortfolioFromCsv:
+    """Test cases for CSV portfolio loading."""
+
+    @pytest.fixture
+    def analyzer(self):
+        """Create an analyzer instance."""
+        return PortfolioAnalyzer()
+
+    def test_load_portfolio(self, analyzer, tmp_path):
+        """Test loading holdings with and without cost basis."""
+        csv_path = tmp_path / "portfolio.csv"
+        csv_path.write_text("symbol,shares,cost_basis\naapl,10,150.50\nMSFT,5,\n,3,100\n")
+
+        portfolio = analyzer.load_portfolio_from_csv(csv_path)
+
+        assert portfolio.name == "portfolio"
+        assert [h.symbol for h in portfolio.holdings] == ["AAPL", "MSFT"]
+        assert portfolio.holdings[0].shares == 10.0
+        assert portfolio.holdings[0].cost_basis == 150.5
+        assert portfolio.holdings[1].cost_basis is None
+
+    def test_load_portfolio_column_order(self, analyzer, tmp_path):
+        """Test columns are resolved by header name rather than position."""
+        csv_path = tmp_path / "reordered.csv"
+        csv_path.write_text("shares,symbol\n7,GOOGL\n")
+
+        portfolio = analyzer.load_portfolio_from_csv(csv_path)
+
+        assert len(portfolio.holdings) == 1
+        assert portfolio.holdings[0].symbol == "GOOGL"
+        assert portfolio.holdings[0].shares == 7.0
+        assert portfolio.holdings[0].cost_basis is None
+
+
+class TestNewsAndSentimentSteps:
+    """Test cases for the batched news and sentiment steps with per-symbol fallback."""
+
+    HOLDINGS = [StockHolding(symbol="AAPL", shares=1), StockHolding(symbol="MSFT", shares=1)]
+
+    @pytest.fixture
+    def analyzer(self):
+        """Create an analyzer with an LLM API key configured."""
+        analyzer = PortfolioAnalyzer()
+        analyzer.settings = analyzer.settings.model_copy(
+            update={
+                "sentiment_backend": SentimentBackend.LLM,
+                "batch_mode": False,
+                "openai_api_key": SecretStr("sk-test"),
+                "anthropic_api_key": SecretStr("sk-test"),
+            }
+        )
+        return analyzer
+
+    def test_fetch_news_falls_back_per_symbol(self, analyzer, make_articles):
+        """Test symbols missed by the bulk request are fetched individually."""
+        analyzer.news_fetcher = StubNewsFetcher({"AAPL"}, make_articles)
+
+        news = analyzer._fetch_news(self.HOLDINGS)
+
+        assert set(news) == {"AAPL", "MSFT"}
+        assert analyzer.news_fetcher.fetched == ["MSFT"]
+
+    def test_sentiment_falls_back_per_symbol(self, analyzer, make_articles):
+        """Test a symbol missing from the bulk result is analyzed on its own."""
+        analyzer.ai_analyzer = StubAIAnalyzer({"AAPL"})
+        news = {"AAPL": make_articles("AAPL"), "MSFT": make_articles("MSFT")}
+
+        sentiments = analyzer._analyze_sentiments(self.HOLDINGS, news)
+
+        assert sentiments["AAPL"][2] == "bulk"
+        assert sentiments["MSFT"][2] == "single"
+        assert analyzer.ai_analyzer.fallbacks == ["MSFT"]
+
+    def test_sentiment_batch_mode_skips_fallback(self, analyzer, make_articles):
+        """Test batch mode does not re-run missed symbols as interactive calls."""
+        analyzer.settings = analyzer.settings.model_copy(update={"batch_mode": True})
+        analyzer.ai_analyzer = StubAIAnalyzer({"AAPL"})
+        news = {"AAPL": make_articles("AAPL"), "MSFT": make_articles("MSFT")}
+
+        sentiments = analyzer._analyze_sentiments(self.HOLDINGS, news)
+
+        assert set(sentiments) == {"AAPL"}
+        assert analyzer.ai_analyzer.fallbacks == []
+
+    def test_sentiment_without_api_key(self, analyzer, make_articles):
+        """Test no sentiment is produced without an API key for the LLM backend."""
+        analyzer.settings = analyzer.settings.model_copy(update={"openai_api_key": None, "anthropic_api_key": None})
+        analyzer.ai_analyzer = StubAIAnalyzer({"AAPL", "MSFT"})
+
+        assert analyzer._analyze_sentiments(self.HOLDINGS, {"AAPL": make_articles("AAPL")}) == {}
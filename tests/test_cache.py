@@ -0,0 +1,63 @@
+"""Tests for cache helpers."""
+
+from datetime import datetime
+
+from diskcache import Cache
+
+from finops_analyzer.cache import MsgpackDisk, memoize
+
+
+class Counter:
+    """Records how often the memoized method actually runs."""
+
+    def __init__(self):
+        self.calls = 0
+
+    @memoize(maxsize=2)
+    def fetch(self, symbol: str) -> str:
+        self.calls += 1
+        return symbol.lower()
+
+
+class TestMemoize:
+    """Test cases for the in-process memo decorator."""
+
+    def test_repeated_call_is_memoized(self):
+        """Test a repeated call returns the memoized value without re-running."""
+        Counter.fetch.cache_clear()
+        counter = Counter()
+
+        assert counter.fetch("AAPL") == "aapl"
+        assert counter.fetch("AAPL") == "aapl"
+        assert counter.calls == 1
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test the oldest entry is dropped once maxsize is exceeded."""
+        Counter.fetch.cache_clear()
+        counter = Counter()
+
+        counter.fetch("AAPL")
+        counter.fetch("MSFT")
+        counter.fetch("AAPL")
+        counter.fetch("XOM")  # evicts MSFT
+        counter.fetch("AAPL")
+        counter.fetch("MSFT")
+
+        assert counter.calls == 4
+
+
+class TestMsgpackDisk:
+    """Test cases for the msgpack cache serializer."""
+
+    def test_round_trip(self, tmp_path):
+        """Test article dumps and raw buffers come back unchanged."""
+        value = {
+            "articles": [{"title": "Earnings beat", "published_at": datetime(2024, 5, 1, 9, 30)}],
+            "close": b"\x00\x01\x02",
+            "n": 3,
+        }
+
+        with Cache(str(tmp_path), disk=MsgpackDisk) as cache:
+            cache.set("key", value)
+
+            assert cache.get("key") == value
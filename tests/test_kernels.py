@@ -0,0 +1,54 @@
+"""Tests for technical indicator kernels."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from finops_analyzer import _kernels
+
+RSI_IMPLEMENTATIONS = [_kernels.rsi, _kernels._rsi_loop, _kernels._rsi_numpy]
+VOLATILITY_IMPLEMENTATIONS = [_kernels.volatility, _kernels._volatility_loop, _kernels._volatility_numpy]
+MOVING_AVERAGE_IMPLEMENTATIONS = [
+    _kernels.moving_average,
+    _kernels._moving_average_loop,
+    _kernels._moving_average_numpy,
+]
+
+
+@pytest.fixture
+def prices():
+    """Generate a deterministic random-walk price series."""
+    rng = np.random.default_rng(42)
+    return 100 + np.cumsum(rng.normal(0, 2, 250))
+
+
+class TestKernels:
+    """Test cases comparing kernels with the pandas reference calculations."""
+
+    @pytest.mark.parametrize("rsi", RSI_IMPLEMENTATIONS)
+    def test_rsi(self, rsi, prices):
+        """Test RSI matches the rolling-mean pandas implementation."""
+        delta = pd.Series(prices).diff()
+        gain = delta.where(delta > 0, 0).rolling(window=14).mean()
+        loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+        expected = (100 - (100 / (1 + gain / loss))).iloc[-1]
+
+        assert rsi(prices, 14) == pytest.approx(expected)
+
+    @pytest.mark.parametrize("rsi", RSI_IMPLEMENTATIONS)
+    def test_rsi_without_losses(self, rsi):
+        """Test RSI is 100 when prices only rise."""
+        assert rsi(np.arange(1.0, 20.0), 14) == 100.0
+
+    @pytest.mark.parametrize("volatility", VOLATILITY_IMPLEMENTATIONS)
+    def test_volatility(self, volatility, prices):
+        """Test volatility matches annualized std of the last 30 returns."""
+        returns = pd.Series(prices).pct_change().dropna()
+        expected = returns.tail(30).std() * (252**0.5) * 100
+
+        assert volatility(prices, 30) == pytest.approx(expected)
+
+    @pytest.mark.parametrize("moving_average", MOVING_AVERAGE_IMPLEMENTATIONS)
+    def test_moving_average(self, moving_average, prices):
+        """Test moving average matches the mean of the trailing window."""
+        assert moving_average(prices, 50) == pytest.approx(prices[-50:].mean())
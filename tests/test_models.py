@@ -0,0 +1,65 @@
+"""Tests for portfolio models."""
+
+import pytest
+
+from finops_analyzer.models import Portfolio, StockHolding
+
+
+@pytest.fixture
+def portfolio():
+    """Create an enriched sample portfolio."""
+    return Portfolio(
+        holdings=[
+            StockHolding(symbol="AAPL", shares=10, cost_basis=100, current_price=150, sector="Technology"),
+            StockHolding(symbol="MSFT", shares=5, cost_basis=200, current_price=300, sector="Technology"),
+            StockHolding(symbol="XOM", shares=20, cost_basis=60, current_price=50, sector="Energy"),
+        ]
+    )
+
+
+class TestPortfolio:
+    """Test cases for Portfolio aggregates."""
+
+    def test_totals(self, portfolio):
+        """Test portfolio totals are calculated correctly."""
+        assert portfolio.total_value == 4000
+        assert portfolio.total_cost == 3200
+        assert portfolio.total_gain_loss == 800
+        assert portfolio.total_gain_loss_percent == pytest.approx(25.0)
+
+    def test_allocation(self, portfolio):
+        """Test holding and sector allocations add up to 100%."""
+        assert portfolio.get_allocation() == pytest.approx({"AAPL": 37.5, "MSFT": 37.5, "XOM": 25.0})
+        assert portfolio.get_sector_allocation() == pytest.approx({"Technology": 75.0, "Energy": 25.0})
+
+    def test_finalize_matches_live_totals(self, portfolio):
+        """Test finalized aggregates match the live calculations."""
+        expected = (portfolio.total_value, portfolio.total_cost, portfolio.get_sector_allocation())
+
+        portfolio.finalize()
+
+        assert (portfolio.total_value, portfolio.total_cost, portfolio.get_sector_allocation()) == expected
+
+    def test_finalize_invalidated_by_new_holding(self, portfolio):
+        """Test adding a holding after finalize() discards the stale snapshot."""
+        portfolio.finalize()
+        portfolio.holdings.append(StockHolding(symbol="GLD", shares=4, current_price=250))
+
+        assert portfolio.total_value == 5000
+        assert "GLD" in portfolio.get_allocation()
+
+    def test_finalize_invalidated_by_replaced_holdings(self, portfolio):
+        """Test replacing the holdings list with one of the same length discards the snapshot."""
+        portfolio.finalize()
+        portfolio.holdings = [h.model_copy(update={"current_price": 100}) for h in portfolio.holdings]
+
+        assert portfolio.total_value == 3500
+
+    def test_empty_portfolio(self):
+        """Test an empty portfolio has zero totals and no allocation."""
+        portfolio = Portfolio()
+        portfolio.finalize()
+
+        assert portfolio.total_value == 0
+        assert portfolio.get_allocation() == {}
+        assert portfolio.get_sector_allocation() == {}
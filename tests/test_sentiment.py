@@ -0,0 +1,464 @@
+"""Tests for sentiment module."""
+
+import json
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from finops_analyzer.config import AIProvider, SentimentBackend, get_settings
+from finops_analyzer.models import SentimentScore
+from finops_analyzer.sentiment import BATCH_MAX_POLL_ERRORS, MAX_OUTPUT_TOKENS, AIAnalyzer
+
+
+def bulk_response(symbols: list[str]) -> str:
+    """Build a bulk sentiment response covering the given symbols."""
+    results = {
+        symbol: {
+            "articles": [{"index": 0, "sentiment": "bullish", "reasoning": "Beat estimates", "key_points": ["beat"]}],
+            "overall_sentiment": "bullish",
+            "summary": f"{symbol} looks strong",
+        }
+        for symbol in symbols
+    }
+    return json.dumps({"results": results})
+
+
+class TestAnalyzeSentimentBulk:
+    """Test cases for batched AI sentiment analysis."""
+
+    @pytest.fixture
+    def analyzer(self):
+        """Create an analyzer using the LLM backend outside batch mode."""
+        analyzer = AIAnalyzer()
+        analyzer.settings = get_settings().model_copy(
+            update={"sentiment_backend": SentimentBackend.LLM, "batch_mode": False, "sentiment_batch_size": 10}
+        )
+        return analyzer
+
+    @pytest.fixture
+    def prompts(self, analyzer, monkeypatch):
+        """Stub the AI call to answer for every symbol heading in the prompt."""
+        prompts = []
+
+        def call_ai(system_prompt, user_prompt, max_tokens=None):
+            prompts.append(user_prompt)
+            return bulk_response(re.findall(r"^## (\S+)$", user_prompt, re.MULTILINE))
+
+        monkeypatch.setattr(analyzer, "_call_ai", call_ai)
+        return prompts
+
+    def test_results_mapped_to_each_symbol(self, analyzer, prompts, make_articles):
+        """Test each symbol's entry in the response is applied to that symbol's articles."""
+        payload = {"AAPL": make_articles("AAPL"), "MSFT": make_articles("MSFT")}
+
+        results = analyzer.analyze_sentiment_bulk(payload)
+
+        assert len(prompts) == 1
+        assert set(results) == {"AAPL", "MSFT"}
+        articles, overall, summary = results["MSFT"]
+        assert articles is payload["MSFT"]
+        assert articles[0].sentiment == SentimentScore.BULLISH
+        assert articles[0].key_points == ["beat"]
+        assert articles[1].sentiment is None
+        assert overall == SentimentScore.BULLISH
+        assert summary == "MSFT looks strong"
+
+    def test_symbol_missing_from_response_is_left_out(self, analyzer, monkeypatch, make_articles):
+        """Test a symbol absent from the response is omitted so the caller can fall back."""
+        monkeypatch.setattr(analyzer, "_call_ai", lambda system_prompt, user_prompt, **kwargs: bulk_response(["AAPL"]))
+
+        results = analyzer.analyze_sentiment_bulk({"AAPL": make_articles("AAPL"), "MSFT": make_articles("MSFT")})
+
+        assert set(results) == {"AAPL"}
+
+    @pytest.mark.parametrize("response", ["not json at all", '{"summary": "no results key"}', '{"results": []}'])
+    def test_malformed_response(self, analyzer, monkeypatch, response, make_articles):
+        """Test a malformed bulk response yields no results."""
+        monkeypatch.setattr(analyzer, "_call_ai", lambda system_prompt, user_prompt, **kwargs: response)
+
+        assert analyzer.analyze_sentiment_bulk({"AAPL": make_articles("AAPL"), "MSFT": make_articles("MSFT")}) == {}
+
+    @pytest.mark.parametrize("entry", [["not a dict"], [{"index": "0", "sentiment": "bullish"}]])
+    def test_malformed_symbol_entry_is_left_out(self, analyzer, monkeypatch, entry, make_articles):
+        """Test a bad article entry drops only that symbol instead of aborting the bulk call."""
+        data = json.loads(bulk_response(["AAPL", "MSFT"]))
+        data["results"]["MSFT"]["articles"] = entry
+        monkeypatch.setattr(analyzer, "_call_ai", lambda system_prompt, user_prompt, **kwargs: json.dumps(data))
+
+        results = analyzer.analyze_sentiment_bulk({"AAPL": make_articles("AAPL"), "MSFT": make_articles("MSFT")})
+
+        assert set(results) == {"AAPL"}
+
+    def test_single_symbol_uses_per_symbol_analysis(self, analyzer, monkeypatch, make_articles):
+        """Test a one-symbol payload skips the bulk prompt."""
+        calls = []
+
+        def analyze_sentiment(symbol, articles):
+            calls.append(symbol)
+            return articles, SentimentScore.NEUTRAL, "single"
+
+        def analyze_batch(payload):
+            raise AssertionError("bulk prompt used for a single symbol")
+
+        monkeypatch.setattr(analyzer, "analyze_sentiment", analyze_sentiment)
+        monkeypatch.setattr(analyzer, "_analyze_sentiment_batch", analyze_batch)
+
+        results = analyzer.analyze_sentiment_bulk({"AAPL": make_articles("AAPL"), "MSFT": []})
+
+        assert calls == ["AAPL"]
+        assert results["AAPL"][1:] == (SentimentScore.NEUTRAL, "single")
+
+    def test_sub_batches_by_batch_size(self, analyzer, prompts, make_articles):
+        """Test symbols are split into batch-size chunks and every chunk's results are merged."""
+        symbols = [f"SYM{i}" for i in range(25)]
+
+        results = analyzer.analyze_sentiment_bulk({symbol: make_articles(symbol) for symbol in symbols})
+
+        assert len(prompts) == 3
+        assert [len(re.findall(r"^## ", prompt, re.MULTILINE)) for prompt in prompts] == [10, 10, 5]
+        assert set(results) == set(symbols)
+
+    def test_batches_stay_within_output_limit(self, analyzer, monkeypatch, make_articles):
+        """Test each bulk call asks for enough output tokens without exceeding the cap."""
+        calls = []
+
+        def call_ai(system_prompt, user_prompt, max_tokens=None):
+            symbols = re.findall(r"^## (\S+)$", user_prompt, re.MULTILINE)
+            calls.append((symbols, max_tokens))
+            return bulk_response(symbols)
+
+        monkeypatch.setattr(analyzer, "_call_ai", call_ai)
+        payload = {f"SYM{i}": make_articles(f"SYM{i}", 5) for i in range(10)}
+
+        results = analyzer.analyze_sentiment_bulk(payload)
+
+        assert len(calls) > 1
+        for symbols, max_tokens in calls:
+            needed = analyzer._sentiment_output_tokens({symbol: payload[symbol] for symbol in symbols})
+            assert needed <= max_tokens <= MAX_OUTPUT_TOKENS
+        assert set(results) == set(payload)
+
+
+class TestCallAi:
+    """Test cases for AI response caching."""
+
+    @pytest.fixture
+    def analyzer(self, monkeypatch):
+        """Create an analyzer whose provider calls return queued responses."""
+        analyzer = AIAnalyzer()
+        analyzer.responses = []
+        monkeypatch.setattr(analyzer, "_call_openai", lambda *args, **kwargs: analyzer.responses.pop(0))
+        monkeypatch.setattr(analyzer, "_call_anthropic", lambda *args, **kwargs: analyzer.responses.pop(0))
+        return analyzer
+
+    def test_parseable_response_is_cached(self, analyzer):
+        """Test a valid response is served from the cache on the next call."""
+        analyzer.responses = ['{"overall_sentiment": "bullish"}']
+
+        assert analyzer._call_ai("system", "prompt") == '{"overall_sentiment": "bullish"}'
+        assert analyzer._call_ai("system", "prompt") == '{"overall_sentiment": "bullish"}'
+
+    def test_truncated_response_is_not_cached(self, analyzer):
+        """Test a cut-off response is retried rather than replayed from the cache."""
+        analyzer.responses = ['{"overall_sentiment": "bull', '{"overall_sentiment": "bullish"}']
+
+        assert analyzer._call_ai("system", "prompt") == '{"overall_sentiment": "bull'
+        assert analyzer._call_ai("system", "prompt") == '{"overall_sentiment": "bullish"}'
+
+
+class TestParseJson:
+    """Test cases for extracting the JSON object from an AI response."""
+
+    def test_fenced_json(self):
+        """Test a response wrapped in a ```json fence is decoded."""
+        response = '```json\n{"overall_sentiment": "bullish", "articles": []}\n```'
+
+        assert AIAnalyzer._parse_json(response) == {"overall_sentiment": "bullish", "articles": []}
+
+    def test_leading_prose(self):
+        """Test text before the object is skipped."""
+        response = 'Here is the analysis you asked for:\n{"overall_sentiment": "bearish"}'
+
+        assert AIAnalyzer._parse_json(response) == {"overall_sentiment": "bearish"}
+
+    def test_trailing_prose_with_braces(self):
+        """Test trailing text containing braces falls back to decoding the first object."""
+        response = '{"overall_sentiment": "neutral"}\nNote: scores use the {bearish, bullish} scale.'
+
+        assert AIAnalyzer._parse_json(response) == {"overall_sentiment": "neutral"}
+
+    def test_no_object(self):
+        """Test a response without any JSON object raises a decode error."""
+        with pytest.raises(json.JSONDecodeError):
+            AIAnalyzer._parse_json("I could not analyze these articles.")
+
+
+class StubFinBERT:
+    """FinBERT pipeline stub returning a fixed prediction per input text."""
+
+    def __init__(self, predictions):
+        self.predictions = predictions
+        self.calls = []
+
+    def __call__(self, texts, batch_size, truncation):
+        self.calls.append(texts)
+        return [{"label": label, "score": score} for label, score in map(self.predictions.get, texts)]
+
+
+class TestAnalyzeSentimentFinbert:
+    """Test cases for local FinBERT sentiment analysis."""
+
+    @pytest.fixture
+    def analyzer(self):
+        """Create an analyzer using the FinBERT backend."""
+        analyzer = AIAnalyzer()
+        analyzer.settings = get_settings().model_copy(update={"sentiment_backend": SentimentBackend.FINBERT})
+        return analyzer
+
+    def test_labels_mapped_to_articles(self, analyzer, make_articles):
+        """Test predictions from one batched pass land on the right article of each symbol."""
+        analyzer._finbert = StubFinBERT(
+            {
+                "AAPL headline 0": ("positive", 0.95),
+                "AAPL headline 1": ("neutral", 0.80),
+                "MSFT headline 0": ("negative", 0.60),
+                "MSFT headline 1": ("negative", 0.97),
+            }
+        )
+        payload = {"AAPL": make_articles("AAPL"), "MSFT": make_articles("MSFT")}
+
+        results = analyzer.analyze_sentiment_bulk(payload)
+
+        assert len(analyzer._finbert.calls) == 1
+        assert [a.sentiment for a in results["AAPL"][0]] == [SentimentScore.VERY_BULLISH, SentimentScore.NEUTRAL]
+        assert [a.sentiment for a in results["MSFT"][0]] == [SentimentScore.BEARISH, SentimentScore.VERY_BEARISH]
+        assert results["AAPL"][0][0].sentiment_reasoning == "FinBERT: positive (95% confidence)"
+
+    @pytest.mark.parametrize(
+        ("label", "score", "expected"),
+        [
+            ("positive", 0.90, SentimentScore.VERY_BULLISH),
+            ("positive", 0.89, SentimentScore.BULLISH),
+            ("negative", 0.90, SentimentScore.VERY_BEARISH),
+            ("negative", 0.89, SentimentScore.BEARISH),
+            ("neutral", 0.99, SentimentScore.NEUTRAL),
+        ],
+    )
+    def test_confidence_cutoff(self, analyzer, label, score, expected, make_articles):
+        """Test only predictions at or above the strong-confidence cutoff map to the extreme levels."""
+        analyzer._finbert = StubFinBERT({"AAPL headline 0": (label, score)})
+
+        articles, _, _ = analyzer.analyze_sentiment("AAPL", make_articles("AAPL", 1))
+
+        assert articles[0].sentiment == expected
+
+    def test_overall_sentiment_and_summary(self, analyzer, make_articles):
+        """Test the overall sentiment averages article scores and the summary counts labels."""
+        analyzer._finbert = StubFinBERT(
+            {
+                "AAPL headline 0": ("positive", 0.95),
+                "AAPL headline 1": ("neutral", 0.80),
+                "MSFT headline 0": ("negative", 0.60),
+                "MSFT headline 1": ("negative", 0.97),
+            }
+        )
+
+        results = analyzer.analyze_sentiment_bulk({"AAPL": make_articles("AAPL"), "MSFT": make_articles("MSFT")})
+
+        # (1.0 + 0.0) / 2 and (-0.5 + -1.0) / 2
+        assert results["AAPL"][1:] == (
+            SentimentScore.BULLISH,
+            "1 positive, 1 neutral and 0 negative headlines for AAPL (FinBERT).",
+        )
+        assert results["MSFT"][1:] == (
+            SentimentScore.VERY_BEARISH,
+            "0 positive, 0 neutral and 2 negative headlines for MSFT (FinBERT).",
+        )
+
+
+def batch_answer(user_prompt: str) -> str:
+    """Build the batch response a stub provider returns for a prompt."""
+    return json.dumps({"prompt": user_prompt})
+
+
+class StubOpenAIClient:
+    """OpenAI client stub serving one batch whose status checks follow ``statuses``.
+
+    An exception in ``statuses`` is raised by that status check instead.
+    """
+
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.retrieve_calls = 0
+        self.requests = []
+        self.files = SimpleNamespace(create=self._create_file, content=self._file_content)
+        self.batches = SimpleNamespace(create=lambda **kwargs: SimpleNamespace(id="batch-1"), retrieve=self._retrieve)
+
+    def _create_file(self, file, purpose):
+        self.requests = [json.loads(line) for line in file[1].decode("utf-8").splitlines()]
+        return SimpleNamespace(id="file-1")
+
+    def _retrieve(self, batch_id):
+        self.retrieve_calls += 1
+        status = self.statuses.pop(0)
+        if isinstance(status, Exception):
+            raise status
+        return SimpleNamespace(status=status, output_file_id="output-1")
+
+    def _file_content(self, file_id):
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": request["custom_id"],
+                    "response": {
+                        "body": {
+                            "choices": [
+                                {"message": {"content": batch_answer(request["body"]["messages"][1]["content"])}}
+                            ]
+                        }
+                    },
+                }
+            )
+            for request in self.requests
+        ]
+        return SimpleNamespace(text="\n".join(lines))
+
+
+class StubAnthropicClient:
+    """Anthropic client stub serving one message batch whose status checks follow ``statuses``."""
+
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.requests = []
+        self.messages = SimpleNamespace(
+            batches=SimpleNamespace(create=self._create, retrieve=self._retrieve, results=self._results)
+        )
+
+    def _create(self, requests):
+        self.requests = requests
+        return SimpleNamespace(id="batch-1")
+
+    def _retrieve(self, batch_id):
+        status = self.statuses.pop(0)
+        if isinstance(status, Exception):
+            raise status
+        return SimpleNamespace(processing_status=status)
+
+    def _results(self, batch_id):
+        return [
+            SimpleNamespace(
+                custom_id=request["custom_id"],
+                result=SimpleNamespace(
+                    type="succeeded",
+                    message=SimpleNamespace(
+                        content=[SimpleNamespace(text=batch_answer(request["params"]["messages"][0]["content"]))]
+                    ),
+                ),
+            )
+            for request in self.requests
+        ]
+
+
+class TestCallAiBatch:
+    """Test cases for running prompts through the provider batch APIs."""
+
+    @pytest.fixture
+    def make_analyzer(self):
+        """Factory for an analyzer on the given provider that polls without waiting."""
+
+        def factory(provider: AIProvider) -> AIAnalyzer:
+            analyzer = AIAnalyzer()
+            analyzer.settings = get_settings().model_copy(
+                update={"ai_provider": provider, "batch_poll_interval_seconds": 0, "batch_timeout_seconds": 60}
+            )
+            return analyzer
+
+        return factory
+
+    def test_submit_batch(self, make_analyzer):
+        """Test prompts are uploaded under their custom ids and the batch id is returned."""
+        analyzer = make_analyzer(AIProvider.OPENAI)
+        analyzer._openai_client = StubOpenAIClient([])
+
+        assert analyzer.submit_batch("system", [("request-0", "p0"), ("request-1", "p1")]) == "batch-1"
+        requests = analyzer._openai_client.requests
+        assert [request["custom_id"] for request in requests] == ["request-0", "request-1"]
+        assert requests[1]["body"]["messages"] == [
+            {"role": "system", "content": "system"},
+            {"role": "user", "content": "p1"},
+        ]
+
+    def test_submit_batch_failure(self, make_analyzer):
+        """Test a failed submission returns no batch id."""
+        analyzer = make_analyzer(AIProvider.OPENAI)
+        analyzer._openai_client = StubOpenAIClient([])
+
+        def create_file(**kwargs):
+            raise ConnectionError("down")
+
+        analyzer._openai_client.files.create = create_file
+
+        assert analyzer.submit_batch("system", [("request-0", "p0")]) is None
+
+    def test_openai_results_mapped_to_prompts(self, make_analyzer):
+        """Test OpenAI batch output is polled until complete and returned in prompt order."""
+        analyzer = make_analyzer(AIProvider.OPENAI)
+        analyzer._openai_client = StubOpenAIClient(["validating", "in_progress", "completed"])
+
+        responses = analyzer._call_ai_batch("system", ["p0", "p1", "p2"])
+
+        assert responses == [batch_answer("p0"), batch_answer("p1"), batch_answer("p2")]
+        assert [request["custom_id"] for request in analyzer._openai_client.requests] == [
+            "request-0",
+            "request-1",
+            "request-2",
+        ]
+
+    def test_anthropic_results_mapped_to_prompts(self, make_analyzer):
+        """Test Anthropic batch results are polled until ended and returned in prompt order."""
+        analyzer = make_analyzer(AIProvider.ANTHROPIC)
+        analyzer._anthropic_client = StubAnthropicClient(["in_progress", "ended"])
+
+        responses = analyzer._call_ai_batch("system", ["p0", "p1"])
+
+        assert responses == [batch_answer("p0"), batch_answer("p1")]
+        assert [request["custom_id"] for request in analyzer._anthropic_client.requests] == ["request-0", "request-1"]
+
+    def test_cached_responses_are_reused(self, make_analyzer):
+        """Test cached prompts are not resubmitted and later runs are served from the cache."""
+        analyzer = make_analyzer(AIProvider.OPENAI)
+        analyzer._cache.set(analyzer._response_cache_key("system", "p1"), batch_answer("p1"))
+        analyzer._openai_client = StubOpenAIClient(["completed"])
+
+        responses = analyzer._call_ai_batch("system", ["p0", "p1", "p2"])
+
+        assert responses == [batch_answer("p0"), batch_answer("p1"), batch_answer("p2")]
+        assert [request["custom_id"] for request in analyzer._openai_client.requests] == ["request-0", "request-2"]
+
+        analyzer._openai_client = StubOpenAIClient([])
+        assert analyzer._call_ai_batch("system", ["p0", "p1", "p2"]) == responses
+        assert analyzer._openai_client.requests == []
+
+    def test_poll_errors_are_retried(self, make_analyzer):
+        """Test a failed status check keeps polling instead of abandoning the batch."""
+        analyzer = make_analyzer(AIProvider.ANTHROPIC)
+        analyzer._anthropic_client = StubAnthropicClient([ConnectionError("reset"), "in_progress", "ended"])
+
+        assert analyzer._call_ai_batch("system", ["p0"]) == [batch_answer("p0")]
+
+    def test_repeated_poll_errors_give_up(self, make_analyzer):
+        """Test polling stops after too many consecutive failed status checks."""
+        analyzer = make_analyzer(AIProvider.OPENAI)
+        analyzer._openai_client = StubOpenAIClient([ConnectionError("down")] * BATCH_MAX_POLL_ERRORS)
+
+        assert analyzer._call_ai_batch("system", ["p0", "p1"]) == [None, None]
+        assert analyzer._openai_client.retrieve_calls == BATCH_MAX_POLL_ERRORS
+
+    def test_failed_batch_has_no_responses(self, make_analyzer):
+        """Test a batch that ended without output yields no responses and is not polled again."""
+        analyzer = make_analyzer(AIProvider.OPENAI)
+        analyzer._openai_client = StubOpenAIClient(["failed"])
+
+        assert analyzer._call_ai_batch("system", ["p0"]) == [None]
+        assert analyzer._openai_client.retrieve_calls == 1
@@ -2,10 +2,57 @@
 
 import pytest
 from decimal import Decimal
+from types import SimpleNamespace
 
 from finops_analyzer.models import StockHolding
 from finops_analyzer.stock_fetcher import StockDataFetcher
 
+INFO = {
+    "longName": "Apple Inc.",
+    "sector": "Technology",
+    "industry": "Consumer Electronics",
+    "trailingPE": 30.5,
+    "dividendYield": 0.5,
+    "currentPrice": 180.0,
+    "marketCap": 2.8e12,
+    "fiftyTwoWeekHigh": 200.0,
+    "fiftyTwoWeekLow": 150.0,
+}
+
+
+class FakeCache(dict):
+    """In-memory stand-in for the disk cache."""
+
+    def set(self, key, value, expire=None):
+        self[key] = value
+
+
+class FailingFastInfo:
+    """fast_info whose fields all fail, like a transient quote endpoint error."""
+
+    def __getattr__(self, name):
+        raise RuntimeError("quote endpoint unavailable")
+
+
+class FakeTicker:
+    """Stubbed yfinance ticker that counts quote and summary lookups."""
+
+    def __init__(self, fast_info, info=INFO):
+        self._fast_info = fast_info
+        self._info = info
+        self.fast_info_calls = 0
+        self.info_calls = 0
+
+    @property
+    def fast_info(self):
+        self.fast_info_calls += 1
+        return self._fast_info
+
+    @property
+    def info(self):
+        self.info_calls += 1
+        return self._info
+
 
 class TestStockDataFetcher:
     """Test cases for StockDataFetcher."""
@@ -15,6 +62,12 @@ class TestStockDataFetcher:
         """Create a fetcher instance."""
         return StockDataFetcher()
     
+    def test_fetch_fast_info(self, fetcher):
+        """Test fetching the lightweight quote for a valid symbol."""
+        quote = fetcher.fetch_fast_info("AAPL")
+        
+        assert quote["lastPrice"] > 0
+    
     def test_fetch_stock_info(self, fetcher):
         """Test fetching stock info for a valid symbol."""
         info = fetcher.fetch_stock_info("AAPL")
@@ -22,6 +75,13 @@ class TestStockDataFetcher:
         assert info is not None
         assert "currentPrice" in info or "regularMarketPrice" in info
     
+    def test_fetch_full_info(self, fetcher):
+        """Test fetching the profile summary for a valid symbol."""
+        info = fetcher.fetch_full_info("AAPL")
+        
+        assert info is not None
+        assert "sector" in info
+    
     def test_fetch_history(self, fetcher):
         """Test fetching historical data."""
         history = fetcher.fetch_history("AAPL", period_days=30)
@@ -78,3 +138,99 @@ class TestStockHolding:
         
         assert holding.total_gain_loss == Decimal("500")
         assert holding.gain_loss_percent == 50.0
+
+
+class TestEnrichHolding:
+    """Offline test cases for choosing between the quote and the full summary."""
+
+    METHODS = (
+        StockDataFetcher.fetch_fast_info,
+        StockDataFetcher.fetch_stock_info,
+        StockDataFetcher.fetch_full_info,
+    )
+
+    @pytest.fixture
+    def fetcher(self):
+        """Create a fetcher backed by an in-memory cache and clear the lookup memos."""
+        for method in self.METHODS:
+            method.cache_clear()
+        fetcher = StockDataFetcher()
+        fetcher._cache = FakeCache()
+        yield fetcher
+        for method in self.METHODS:
+            method.cache_clear()
+
+    def test_cold_profile_uses_one_summary(self, fetcher):
+        """Test a cold profile cache is served by a single full summary for quote and profile."""
+        quote = SimpleNamespace(last_price=190.0, market_cap=3e12, year_high=210.0, year_low=160.0)
+        ticker = FakeTicker(quote)
+        fetcher._tickers["AAPL"] = ticker
+
+        holding = fetcher.enrich_holding(StockHolding(symbol="AAPL", shares=1))
+
+        assert holding.current_price == 180.0
+        assert holding.market_cap == 2.8e12
+        assert holding.company_name == "Apple Inc."
+        assert holding.sector == "Technology"
+        assert (ticker.info_calls, ticker.fast_info_calls) == (1, 0)
+        assert "info_AAPL" in fetcher._cache
+        assert fetcher._cache["full_info_AAPL"] == INFO
+
+    def test_quote_present(self, fetcher):
+        """Test market data comes from the quote once the profile is cached."""
+        fetcher._cache["full_info_AAPL"] = INFO
+        quote = SimpleNamespace(last_price=190.0, market_cap=3e12, year_high=210.0, year_low=160.0)
+        ticker = FakeTicker(quote)
+        fetcher._tickers["AAPL"] = ticker
+
+        holding = fetcher.enrich_holding(StockHolding(symbol="AAPL", shares=1))
+
+        assert holding.current_price == 190.0
+        assert holding.market_cap == 3e12
+        assert (holding.fifty_two_week_high, holding.fifty_two_week_low) == (210.0, 160.0)
+        assert holding.company_name == "Apple Inc."
+        assert holding.sector == "Technology"
+        assert ticker.info_calls == 0
+        assert "fast_info_AAPL" in fetcher._cache
+
+    def test_quote_partly_missing(self, fetcher):
+        """Test missing quote fields stay empty rather than coming from the profile."""
+        fetcher._cache["full_info_AAPL"] = INFO
+        quote = SimpleNamespace(last_price=190.0, market_cap=None, year_high=210.0, year_low=None)
+        fetcher._tickers["AAPL"] = FakeTicker(quote)
+
+        holding = fetcher.enrich_holding(StockHolding(symbol="AAPL", shares=1))
+
+        assert holding.current_price == 190.0
+        assert holding.market_cap is None
+        assert holding.fifty_two_week_low is None
+        assert holding.sector == "Technology"
+
+    def test_quote_failing_is_not_cached(self, fetcher):
+        """Test a failed quote falls back to fresh info and is retried on the next lookup."""
+        fetcher._cache["full_info_AAPL"] = INFO
+        ticker = FakeTicker(FailingFastInfo())
+        fetcher._tickers["AAPL"] = ticker
+
+        holding = fetcher.enrich_holding(StockHolding(symbol="AAPL", shares=1))
+        fetcher.enrich_holding(StockHolding(symbol="AAPL", shares=1))
+
+        assert holding.current_price == 180.0
+        assert holding.fifty_two_week_high == 200.0
+        assert holding.sector == "Technology"
+        assert "fast_info_AAPL" not in fetcher._cache
+        assert "info_AAPL" in fetcher._cache
+        assert ticker.fast_info_calls == 2
+
+    def test_profile_already_populated(self, fetcher):
+        """Test the full summary is not fetched when the profile fields are already set."""
+        quote = SimpleNamespace(last_price=190.0, market_cap=3e12, year_high=210.0, year_low=160.0)
+        ticker = FakeTicker(quote)
+        fetcher._tickers["AAPL"] = ticker
+
+        holding = fetcher.enrich_holding(
+            StockHolding(symbol="AAPL", shares=1, company_name="Apple Inc.", sector="Technology")
+        )
+
+        assert holding.current_price == 190.0
+        assert ticker.info_calls == 0